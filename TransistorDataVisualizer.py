@@ -1,94 +1,160 @@
 # imports required for everything
 import numpy as np
-import matplotlib.pyplot as plt
+from importlib import import_module
 
 from dataclasses import dataclass # import required for DataFile
 
 # imports required for File
 from csv import reader as csvreader
 from json import load as jsonload
+from pathlib import Path
+
+# imports required for ParseCache
+import os
+import shutil
+from tempfile import mkdtemp
+from hashlib import sha1
+from json import dump as jsondump
+
+# imports required for CampaignArchive
+import zlib
+import struct
+from json import dumps as jsondumps, loads as jsonloads
+
+# imports required for load_campaign
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from concurrent.futures.process import BrokenProcessPool
+from time import perf_counter
+
+# imports required for DeviceRegistry
+from time import monotonic
+
+# imports required for LiveReader and InstrumentEmulator
+from threading import Thread, Event
+from queue import Queue, Empty
+from socket import socket, create_server
+from time import sleep
+
+# imports required for DataBank.groupby
+from copy import copy
+
+# imports required for DataBank.stack
+from weakref import WeakSet
+
+# matplotlib (pyplot especially) is slow to import, so it's only imported once something is plotted.
+# Parsing and analysis don't need it, so `import TransistorDataVisualizer` stays fast for them.
+class _LazyModule:
+    '''Stands in for a matplotlib module, which is imported the first time one of its attributes is used.'''
+    def __init__(self, name: str):
+        self._name = name
+        self._module = None
+
+    def __getattr__(self, attr: str):
+        if self._module is None:
+            import_module('matplotlib.pyplot') # pyplot pulls in the backend and every submodule used here
+            self._module = import_module(self._name)
+        return getattr(self._module, attr)
+
+plt = _LazyModule('matplotlib.pyplot')
 
 # imports required for DataSet and DataBank
-import matplotlib as mpl
+mpl = _LazyModule('matplotlib')
 # really, mpl.cm, mpl.ticker, and mpl.colors are used
+art3d = _LazyModule('mpl_toolkits.mplot3d.art3d') # Line3DCollection for the 3D plots
 
 # imports required for Plotter
-import matplotlib.patches as mpatches
-import matplotlib.lines as mlines
-import matplotlib.animation as animation
+mpatches = _LazyModule('matplotlib.patches')
+mlines = _LazyModule('matplotlib.lines')
+animation = _LazyModule('matplotlib.animation')
 
 # ==============================================================================
 #               DataFile
 # ==============================================================================
 @dataclass
 class DataFile:
-    def __init__(self, code: str, path: str, misc = None):
+    def __init__(self, code: str, path: str, misc = None, dtype = np.float64):
         ''''''
         self.file_code:str = code
         self.file_path: str = path
         self.misc = misc
         # misc can store any other relevant info, like cryo, epoxy, data quality etc
+        self.dtype = dtype # storage precision of the parsed data, e.g. np.float32 to halve memory use
 
     def print(self):
         print("File Code Name: ", self.file_code)
         print("File Location: ", self.file_path)
         print(f"Miscellaneous: {self.misc}")
+        print(f"Data Type: {np.dtype(self.dtype)}")
 
 # ==============================================================================
-#               File
+#               FileHeader
 # ==============================================================================
-class File:
+class FileHeader:
     def __init__(self, DataFile: DataFile):
+        '''Metadata-only view of an easyEXPERT csv. Only the header section (SetupTitle through DataName)
+        is read; scanning stops before the first DataValue row, so no numeric data is loaded.'''
+        self._init_header(DataFile)
+        with open(DataFile.file_path, 'r') as csvfile:
+            self._read_header(csvfile)
+        self._process_interval()
+        self._check_missing_headers()
+        self.m_shape = (self.m_dim2_count, self.m_dim1_count)
+
+    def _init_header(self, DataFile: DataFile):
+        '''Sets up the header attributes shared by FileHeader and File'''
         self.m_headers = []
-        self.m_title: str
+        self.m_title: str = ''
+        self.m_setup_title: str = ''
         self.m_gate_type: str = ''
         self.m_dim1_count: int
         self.m_dim2_count: int
-        self.m_sweep_type: str
+        self.m_sweep_type: str = ''
         self.file_type: str = DataFile.file_code
-        self.m_datadict: dict = {}
+        self.file_path: str = DataFile.file_path
         self.m_shape: tuple # 2D shape tuple
         self.m_intervals: dict # dim1 and dim2 intervals from 'start' to 'stop' in steps of 'step'
         self.m_intervals_info: dict
-        self.__process_csv(DataFile.file_path)
-        self.__process_interval()
-        self.reshape_data()
-        self.__check_missing_dims()
-
-
-    def __process_csv(self, input_file):
-        '''Scrapes all pertinent data from the easyEXPERT csv into the File object.'''
-        with open(input_file, 'r') as csvfile:
-            reader = csvreader(csvfile, delimiter = ',') # change contents to floats
-            data_idx = 0 # data row index -- which row in specifically the numerical data columns we're at
-            for row in reader: # each row is a list
-                match row[0].strip():
-                    case 'PrimitiveTest':
-                        self.m_sweep_type = row[1].strip()
-                    case 'TestParameter':
-                        self.__process_TestParameters(row)
-                    case 'Dimension1':
-                        self.m_dim1_count = int(row[1])
-                    case 'Dimension2':
-                        self.m_dim2_count = int(row[1])
-                    case 'AnalysisSetup':
-                        if row[1].strip() == 'Analysis.Setup.Title':
-                            self.m_title = row[2].strip()
-                    case 'DataName': # This comes directly before the DataValue entries
-                        for i, header in enumerate(row):
-                            if i == 0:
-                                continue
-                            self.m_headers.append(header.strip())
-
-                            # this allocates appropriately-sized numpy arrays for the data
-                            self.m_datadict[header.strip()] = np.zeros( self.m_dim1_count * self.m_dim2_count )
-                    case 'DataValue': # this inserts data into the appropriate data array spots
-                        for i, v in enumerate(row):
-                            if i == 0:
-                                continue
-                            self.m_datadict[self.m_headers[i-1]][data_idx] = float(v)
-                        data_idx += 1
-        self.m_shape = (self.m_dim2_count, self.m_dim1_count)
+        self.m_channels: dict = {'V': [], 'I': []} # voltage and current channel names, in SMU order
+        self.m_compliance: dict = {} # 'primary', 'secondary' and 'bias' compliance values
+
+    def _read_header(self, csvfile) -> bool:
+        '''Reads the header rows of an open csv file up to and including the DataName row.
+        The file is left positioned at the first DataValue row.
+        Returns True if the DataName row was found.'''
+        reader = csvreader(csvfile, delimiter = ',')
+        for row in reader:
+            if row and row[0].strip() == 'DataValue': # DataName was missing, but there's nothing left to scan
+                return False
+            if self._process_header_row(row): # DataName comes directly before the DataValue entries
+                return True
+        return False
+
+    def _process_header_row(self, row) -> bool:
+        '''Processes a single non-DataValue row of the easyEXPERT csv.
+        Returns True once the DataName row (which comes directly before the DataValue entries) is processed.'''
+        if not row:
+            return False
+        match row[0].strip():
+            case 'SetupTitle':
+                self.m_setup_title = row[1].strip()
+            case 'PrimitiveTest':
+                self.m_sweep_type = row[1].strip()
+            case 'TestParameter':
+                self.__process_TestParameters(row)
+            case 'Dimension1':
+                self.m_dim1_count = int(row[1])
+            case 'Dimension2':
+                self.m_dim2_count = int(row[1])
+            case 'AnalysisSetup':
+                if row[1].strip() == 'Analysis.Setup.Title':
+                    self.m_title = row[2].strip()
+            case 'DataName': # This comes directly before the DataValue entries
+                for i, header in enumerate(row):
+                    if i == 0:
+                        continue
+                    self.m_headers.append(header.strip())
+                return True
+        return False
 
     def __process_TestParameters(self, row):
         """Fetches stop, start, and step/count interval information from eE (easyEXPERT) csv.
@@ -96,24 +162,30 @@ class File:
         match row[1].strip():
             case 'Channel.VName':
                 self.m_intervals = [ [row[2].strip(), {}], [row[3].strip(), {}] ]
+                self.m_channels['V'] = [name.strip() for name in row[2:]]
+            case 'Channel.IName':
+                self.m_channels['I'] = [name.strip() for name in row[2:]]
             case 'Measurement.Primary.Stop':
                 self.m_intervals[0][1]['stop'] = float(row[2].strip()) 
             case 'Measurement.Primary.Count':
                 self.m_intervals[0][1]['count'] = int(row[2].strip()) 
             case 'Measurement.Primary.Step':
                 self.m_intervals[0][1]['step'] = float(row[2].strip())
+            case 'Measurement.Primary.Compliance':
+                self.m_compliance['primary'] = float(row[2].strip())
             case 'Measurement.Bias.Source':
                 self.m_intervals[0][1]['start'] = float(row[2].strip()) 
                 self.m_intervals[1][1]['start'] = float(row[3].strip())
+            case 'Measurement.Bias.Compliance':
+                self.m_compliance['bias'] = [float(v.strip()) for v in row[2:] if v.strip()]
             case 'Measurement.Secondary.Step':
                 self.m_intervals[1][1]['step'] = float(row[2].strip())
             case 'Measurement.Secondary.Count':
                 self.m_intervals[1][1]['count'] = int(row[2].strip())
+            case 'Measurement.Secondary.Compliance':
+                self.m_compliance['secondary'] = float(row[2].strip())
 
-        
-
-
-    def __process_interval(self):
+    def _process_interval(self):
         """Creates the v1, v2 intervals via [start, start+step, ... stop-step, stop].
         Overwrites self.m_intervals w/ new intervals. Calculates start/step/stop when necessary.
         Goal is to get stop, start, and step params to make the intervals using np.arange()
@@ -151,29 +223,743 @@ class File:
         self.m_intervals_info = intervals_info
         self.m_intervals = intervals
 
-
-    def __check_missing_dims(self):
-        """This function checks to see if there are independent variables NOT in m_datadict.
-        If missing variables are found, then a 2D numpy array is created via the meshgrid."""
-
-        header_keys = self.m_headers 
-        # header_keys may or may not contain all interval keys. This determined later on.
-
+    def _check_missing_headers(self) -> str:
+        """Checks to see if there is an independent variable NOT in m_headers.
+        If one is found, it's inserted into m_headers as the 2nd independent variable and its name is returned.
+        Otherwise, an empty string is returned."""
         interval_keys = list(self.m_intervals.keys())
         # interval_keys will contain 2 entries: each independent variable voltage
 
-        keys = ['', ''] # this list will store the order of interval keys
+        missing_key = ''
         for i in [0, 1]:
-            if not interval_keys[i] in header_keys: # if the i-th interval key is NOT in the header keys...
-                keys[1] = interval_keys[i] # set keys[1] to the missing key
+            if not interval_keys[i] in self.m_headers: # if the i-th interval key is NOT in the header keys...
+                missing_key = interval_keys[i]
+        if missing_key:
+            self.m_headers.insert(1, missing_key)
+        return missing_key
+
+    def print(self):
+        """Prints the header information of the csv"""
+        print(f"File: {self.file_path}")
+        print(f"Title: {self.m_title}  ({self.m_sweep_type})")
+        print(f"Headers: {self.m_headers}")
+        print(f"Shape: {self.m_shape}")
+        print(f"Channels: V = {self.m_channels['V']}; I = {self.m_channels['I']}")
+        print(f"Compliance: {self.m_compliance}")
+        for name, info in self.m_intervals_info.items():
+            print(f" {name}: {info}")
+
+    def get_record(self) -> dict:
+        """Returns a compact, plain-python record of the header information for cataloging"""
+        return {'file_code': self.file_type,
+                'file_path': self.file_path,
+                'title': self.m_title,
+                'setup_title': self.m_setup_title,
+                'sweep_type': self.m_sweep_type,
+                'headers': list(self.m_headers),
+                'shape': self.m_shape,
+                'channels': {k: list(v) for k, v in self.m_channels.items()},
+                'compliance': dict(self.m_compliance),
+                'intervals_info': {k: dict(v) for k, v in self.m_intervals_info.items()}}
+
+    def get_data_name(self, index: int):
+        return self.m_headers[index]
+    
+    def get_headers(self):
+        return self.m_headers
+    
+    def get_interval(self, index: int):
+        return self.m_intervals[self.m_headers[index]]
+    
+    def get_interval_name(self, index: int) -> str:
+        return self.m_intervals.keys()[self.m_headers[index]]
+    
+    def get_title(self):
+        """Returns m_title"""
+        return self.m_title
+    
+    def get_interval_info(self, index: int) -> dict:
+        """Returns the interval_info of the data at index specified."""
+        return self.m_intervals_info[self.m_headers[index]]
+
+
+def scan_directory(directory: str, pattern: str = '*.csv', recursive: bool = False) -> list[FileHeader]:
+    """Scans every easyEXPERT csv in a directory, reading only their headers.
+
+    Input:  directory -> path to the directory of csv exports
+            pattern -> glob pattern the file names must match
+            recursive -> whether to also scan subdirectories
+
+    Output: list of FileHeaders, sorted by file path. Files that can't be parsed are skipped with a message."""
+    paths = Path(directory).rglob(pattern) if recursive else Path(directory).glob(pattern)
+    headers = []
+    for path in sorted(paths):
+        try:
+            headers.append(FileHeader(DataFile('', str(path))))
+        except (ValueError, IndexError, KeyError, AttributeError, UnicodeDecodeError) as err:
+            print(f"Skipping '{path}': could not parse header ({err})")
+    return headers
+
+
+# ==============================================================================
+#               ParseCache
+# ==============================================================================
+def _header_meta(File) -> dict:
+    '''The header information of a parsed File as a json-compatible dict'''
+    return {'headers': list(File.m_headers),
+            'dim1_count': File.m_dim1_count,
+            'dim2_count': File.m_dim2_count,
+            'shape': File.m_shape,
+            'title': File.m_title,
+            'setup_title': File.m_setup_title,
+            'sweep_type': File.m_sweep_type,
+            'channels': File.m_channels,
+            'compliance': File.m_compliance,
+            # lists of pairs, so the interval order (which determines the x and y axes) is kept
+            'intervals': [[name, np.asarray(interval).tolist()] for name, interval in File.m_intervals.items()],
+            'intervals_info': [[name, info] for name, info in File.m_intervals_info.items()]}
+
+def _apply_header_meta(File, meta: dict):
+    '''Sets a File's header information from a dict made by _header_meta()'''
+    File.m_headers = list(meta['headers'])
+    File.m_dim1_count, File.m_dim2_count = meta['dim1_count'], meta['dim2_count']
+    File.m_shape = tuple(meta['shape'])
+    File.m_title = meta['title']
+    File.m_setup_title = meta['setup_title']
+    File.m_sweep_type = meta['sweep_type']
+    File.m_channels = meta['channels']
+    File.m_compliance = meta['compliance']
+    File.m_intervals = {name: np.array(interval) for name, interval in meta['intervals']}
+    File.m_intervals_info = {name: info for name, info in meta['intervals_info']}
+
+class ParseCache:
+    def __init__(self, directory: str = None, max_bytes: int = 2 * 1024**3):
+        """Persistent binary cache of parsed csv data, so unchanged csvs don't need to be re-parsed every session.
+        Each entry is keyed by the csv's absolute path, size, and modification time, and holds a
+        memory-mappable .npy of the stacked data arrays plus a small json of the header information.
+
+        Input:  directory -> where to store the cache. Defaults to '~/.tdv_cache'
+                max_bytes -> size budget of the cache; the least recently used entries are evicted past it
+
+        To have every File use the cache, set the File class's cache attribute:
+            File.cache = ParseCache()"""
+        self.directory = Path(directory) if directory else Path.home() / '.tdv_cache'
+        self.max_bytes = max_bytes
+        self.directory.mkdir(parents = True, exist_ok = True)
+
+    def __path_key(self, csv_path) -> str:
+        '''Identifies a csv by its absolute path only'''
+        return sha1(str(Path(csv_path).resolve()).encode()).hexdigest()
+
+    def __entry(self, csv_path) -> Path:
+        '''Returns the entry directory for the current version (size & mtime) of the csv'''
+        stat = os.stat(csv_path)
+        return self.directory / f"{self.__path_key(csv_path)}-{stat.st_size}-{stat.st_mtime_ns}"
+
+    def load(self, File) -> bool:
+        """Fills a File's header and data from the cache via memory mapping.
+        Returns False if there is no up-to-date entry for the File's csv."""
+        entry = self.__entry(File.file_path)
+        if not (entry / 'meta.json').exists():
+            return False
+        try:
+            with open(entry / 'meta.json', 'r') as f:
+                meta = jsonload(f)
+            data = np.load(entry / 'data.npy', mmap_mode = 'c') # copy-on-write: edits never reach the cache
+        except (OSError, ValueError):
+            return False
+        if np.result_type(data.dtype, File.m_dtype) != data.dtype:
+            return False # the cached data is less precise than requested, so parse the csv again
+        if data.dtype != File.m_dtype:
+            data = data.astype(File.m_dtype)
+        _apply_header_meta(File, meta)
+        File.m_datadict = {header: data[i] for i, header in enumerate(meta['headers'])}
+        os.utime(entry / 'meta.json') # mark as recently used for eviction
+        return True
+
+    def store(self, File):
+        """Writes a freshly parsed File to the cache, replacing older entries of the same csv, then evicts
+        least recently used entries if the cache is over its size budget.
+        Several processes may store the same csv at once (e.g. load_campaign() workers): each writes to its own
+        temporary directory, and the first to finish keeps its entry while the others drop their copies.
+        An entry stored at a lower precision than the File's (e.g. float32 for a float64 File) is replaced."""
+        entry = self.__entry(File.file_path)
+        if self.__holds(entry, File.m_dtype): # already stored by another process
+            return
+        for old in self.directory.glob(f"{self.__path_key(File.file_path)}-*"): # entries of older versions of the csv
+            if old != entry and old.suffix != '.tmp':
+                shutil.rmtree(old, ignore_errors = True)
+        temp = Path(mkdtemp(dir = self.directory, prefix = entry.name + '.', suffix = '.tmp'))
+        np.save(temp / 'data.npy', np.stack([File.m_datadict[header] for header in File.m_headers]))
+        with open(temp / 'meta.json', 'w') as f:
+            jsondump(_header_meta(File), f)
+        if (entry / 'meta.json').exists() and not self.__holds(entry, File.m_dtype): # move the less precise entry aside
+            trash = Path(mkdtemp(dir = self.directory, prefix = entry.name + '.', suffix = '.tmp'))
+            try:
+                entry.rename(trash / 'old')
+            except OSError: # another process replaced it first
+                pass
+            shutil.rmtree(trash, ignore_errors = True)
+        try:
+            temp.rename(entry)
+        except OSError: # another process stored the entry first
+            shutil.rmtree(temp, ignore_errors = True)
+            if not (entry / 'meta.json').exists():
+                raise
+            return
+        self.evict(keep = entry)
+
+    def __holds(self, entry: Path, dtype) -> bool:
+        '''Whether entry is stored, with data at least as precise as dtype'''
+        if not (entry / 'meta.json').exists():
+            return False
+        try:
+            stored = np.load(entry / 'data.npy', mmap_mode = 'r').dtype # only reads the .npy header
+        except (OSError, ValueError):
+            return False
+        return np.result_type(stored, dtype) == stored
+
+    def invalidate(self, csv_path: str = None):
+        """Removes the cached entries of the csv at csv_path. If no path is given, the whole cache is cleared."""
+        pattern = f"{self.__path_key(csv_path)}-*" if csv_path else '*'
+        for entry in self.directory.glob(pattern):
+            shutil.rmtree(entry, ignore_errors = True)
+
+    def size(self) -> int:
+        """Returns the total size of the cache in bytes"""
+        return sum(f.stat().st_size for f in self.directory.glob('*/*'))
+
+    def evict(self, keep: Path = None):
+        """Removes least recently used entries until the cache fits in max_bytes. The entry 'keep' is never removed."""
+        entries = []
+        for entry in self.directory.iterdir():
+            if entry.suffix == '.tmp' or not (entry / 'meta.json').exists(): # skip entries still being written
+                continue
+            entries.append(((entry / 'meta.json').stat().st_mtime, entry, sum(f.stat().st_size for f in entry.iterdir())))
+        total = sum(size for _, _, size in entries)
+        for _, entry, size in sorted(entries): # oldest first
+            if total <= self.max_bytes:
+                break
+            if entry == keep:
+                continue
+            shutil.rmtree(entry, ignore_errors = True)
+            total -= size
+
+
+# ==============================================================================
+#               CampaignArchive
+# ==============================================================================
+class CampaignArchive:
+    magic = b'TDVARC1\n'
+    footer = struct.Struct('<QQ8s') # index offset, index length, end marker
+    end_marker = b'TDVAEND\n'
+    def __init__(self, path: str):
+        """A single file holding the parsed data of many DataSets, with their headers, intervals, Info and style.
+        Each data array is stored as its own chunk, optionally compressed, followed by a json index of every
+        DataSet and a fixed size footer pointing at it. Opening an archive only reads the footer and index;
+        a DataSet's chunks are read the first time its data is needed (see DataBank.load_archive()).
+        Uncompressed chunks are memory-mapped, so only the pages that get used are read from disk.
+
+        Input:  path -> archive file. It's created by the first write()"""
+        self.path = Path(path)
+        self.entries: list[dict] = [] # one per DataSet, see write()
+        self.__index_end = len(CampaignArchive.magic) # where the next chunks get written
+        if self.path.exists():
+            self.__read_index()
+
+    def __read_index(self):
+        with open(self.path, 'rb') as f:
+            if f.read(len(CampaignArchive.magic)) != CampaignArchive.magic:
+                raise Exception(f"Error: '{self.path}' is not a campaign archive")
+            size = f.seek(0, os.SEEK_END)
+            if size == len(CampaignArchive.magic): # the first write() was interrupted, so nothing was stored
+                return
+            found = self.__last_footer(f, size)
+            if found is None:
+                raise Exception(f"Error: campaign archive '{self.path}' is truncated")
+            offset, length, self.__index_end = found
+            if self.__index_end != size:
+                print(f"Ignoring the last {size - self.__index_end} bytes of '{self.path}', left by an interrupted write")
+            f.seek(offset)
+            self.entries = jsonloads(f.read(length))['sets']
+
+    def __last_footer(self, f, size: int, block: int = 1 << 20) -> tuple:
+        '''Finds the last complete footer, searching back from the end of the file past any partly written chunks.
+        Returns (index offset, index length, end of the footer), or None if there is no complete footer'''
+        marker, start_of_data = CampaignArchive.end_marker, len(CampaignArchive.magic)
+        lead = CampaignArchive.footer.size - len(marker) # footer bytes before its end marker
+        end = size
+        while end > start_of_data:
+            start = max(end - block, start_of_data)
+            f.seek(start)
+            data = f.read(min(end + len(marker) - 1, size) - start) # overlaps the next block by a marker's length
+            p = data.rfind(marker)
+            while p >= 0:
+                footer_start = start + p - lead
+                if footer_start >= start_of_data:
+                    f.seek(footer_start)
+                    offset, length, _ = CampaignArchive.footer.unpack(f.read(CampaignArchive.footer.size))
+                    if offset >= start_of_data and offset + length == footer_start:
+                        f.seek(offset)
+                        try:
+                            if 'sets' in jsonloads(f.read(length)):
+                                return offset, length, footer_start + CampaignArchive.footer.size
+                        except ValueError: # the marker bytes happened to occur inside a chunk
+                            pass
+                p = data.rfind(marker, 0, p)
+            end = start
+        return None
+
+    def write(self, Sets: list, compress: int = 1):
+        """Appends DataSets to the archive. The new chunks and an updated index are written after the existing
+        contents, so an interrupted write leaves the archive as it was: a failed write() cuts off what it wrote,
+        and if the process dies instead, opening the archive skips back to the last complete index.
+
+        Input:  Sets -> DataSets to add
+                compress -> zlib level of the chunks, 0 to store them uncompressed (and memory-mappable)"""
+        mode = 'r+b' if self.path.exists() else 'w+b'
+        with open(self.path, mode) as f:
+            if mode == 'w+b':
+                f.write(CampaignArchive.magic)
+            f.seek(self.__index_end)
+            entries = []
+            try:
+                for S in Sets:
+                    S.load()
+                    entry = {'file_code': S.file_code, 'file_path': str(S.file_path), 'misc': S.Info.misc,
+                             'header': _header_meta(S),
+                             'info': {k: v for k, v in vars(S.Info).items()},
+                             'style': {'color': list(S.color), 'marker': S.marker, 'ln_style': S.ln_style},
+                             'chunks': []}
+                    for header in S.m_headers:
+                        entry['chunks'].append(self.__write_chunk(f, np.ascontiguousarray(S.m_datadict[header]), compress))
+                    entries.append(entry)
+                index = jsondumps({'sets': self.entries + entries}).encode()
+                offset = f.tell()
+                f.write(index)
+                f.write(CampaignArchive.footer.pack(offset, len(index), CampaignArchive.end_marker))
+            except BaseException: # cut off the partly written chunks, back to the last complete index
+                f.truncate(self.__index_end)
+                raise
+            f.truncate()
+            self.__index_end = f.tell()
+        self.entries += entries
+
+    def __write_chunk(self, f, array: np.ndarray, compress: int) -> dict:
+        chunk = {'dtype': array.dtype.str, 'shape': array.shape, 'compress': compress}
+        if compress:
+            # grouping the n-th bytes of every value together (byte shuffling) makes float data far more compressible
+            data = zlib.compress(array.view(np.uint8).reshape(-1, array.itemsize).T.tobytes(), compress)
+        else:
+            f.seek(-f.tell() % 64, os.SEEK_CUR) # aligned, so it can be memory-mapped as is
+            data = array.tobytes()
+        chunk['offset'], chunk['nbytes'] = f.tell(), len(data)
+        f.write(data)
+        return chunk
+
+    def read_header(self, File, entry: int):
+        """Sets a File's header information from the archive entry"""
+        _apply_header_meta(File, self.entries[entry]['header'])
+
+    def read_data(self, File, entry: int):
+        """Loads a File's data arrays from the chunks of the archive entry"""
+        File.m_datadict = {}
+        with open(self.path, 'rb') as f:
+            for header, chunk in zip(self.entries[entry]['header']['headers'], self.entries[entry]['chunks']):
+                dtype, shape = np.dtype(chunk['dtype']), tuple(chunk['shape'])
+                if chunk['compress']:
+                    f.seek(chunk['offset'])
+                    data = np.frombuffer(zlib.decompress(f.read(chunk['nbytes'])), dtype = np.uint8)
+                    data = data.reshape(dtype.itemsize, -1).T.copy().view(dtype).reshape(shape)
+                else: # copy-on-write: edits never reach the archive
+                    data = np.memmap(self.path, dtype = dtype, mode = 'c', offset = chunk['offset'], shape = shape)
+                if dtype != File.m_dtype:
+                    data = data.astype(File.m_dtype)
+                File.m_datadict[header] = data
+
+    def DataSets(self, indices: list[int] = None) -> list:
+        """Returns lazy DataSets of the archive's entries (all of them by default), with their Info and style restored.
+        Their data is read from the archive the first time it's needed."""
+        Sets = []
+        for i in range(len(self.entries)) if indices is None else indices:
+            entry = self.entries[i]
+            S = DataSet(DataFile(entry['file_code'], entry['file_path'], entry['misc']), lazy = True, archive = (self, i))
+            for k, v in entry['info'].items():
+                setattr(S.Info, k, v)
+            S.color, S.marker, S.ln_style = tuple(entry['style']['color']), entry['style']['marker'], entry['style']['ln_style']
+            Sets.append(S)
+        return Sets
+
+
+# ==============================================================================
+#               Level of detail
+# ==============================================================================
+class LevelOfDetail:
+    def __init__(self, segment_budget: int = 100_000, cache_size: int = 64):
+        """Decimates the wireframes of the 3D plots down to a budget of line segments, and the curves of the
+        2D plots down to 2 points per pixel column, so dense sweeps stay responsive. Each block of points is
+        replaced by its min and max point, which keeps the envelope of the data: peaks narrower than a block
+        still show up.
+
+        Input:  segment_budget -> number of line segments a whole 3D plot is allowed
+                cache_size -> number of decimated 2D curve sets to keep
+        Set full_resolution to True to draw every point, e.g. for the final export of a figure."""
+        self.segment_budget = segment_budget
+        self.cache_size = cache_size
+        self.full_resolution: bool = False
+        self.__curves: dict = {} # key -> decimated curves, see curves()
+
+    def factors(self, shape: tuple, connectors: bool, budget: int = None) -> tuple[int, int]:
+        """Returns the (rows, cols) block size that fits a (rows, cols) wireframe into the budget,
+        (1, 1) when it fits as is or in full resolution."""
+        if budget is None:
+            budget = self.segment_budget
+        rows, cols = shape
+        def segments(fr, fc): # row lines, plus column lines with connectors
+            if (fr, fc) == (1, 1):
+                return rows*(cols - 1) + connectors*cols*(rows - 1)
+            nr, nc = -(-rows//fr), -(-cols//fc) # 2 points per block
+            return nr*(2*nc - 1) + connectors*nc*(2*nr - 1)
+        if self.full_resolution or segments(1, 1) <= budget:
+            return 1, 1
+        # as many blocks along x as along y where possible, like plot_wireframe()'s rcount = ccount default
+        blocks = max(budget, 1)/(2*(1 + connectors))
+        nr = int(min(rows, max(1, np.sqrt(blocks))))
+        nc = int(min(cols, max(1, blocks//nr)))
+        nr = int(min(rows, max(1, blocks//nc))) # in case cols ran out first
+        fr, fc = -(-rows//nr), -(-cols//nc)
+        while segments(fr, fc) > budget and (fr < rows or fc < cols): # ceil() rounding can leave it a bit over
+            if (fc < cols and -(-cols//fc) >= -(-rows//fr)) or fr == rows:
+                fc += 1
+            else:
+                fr += 1
+        return fr, fc
+
+    def envelope(self, x: np.ndarray, y: np.ndarray, z: np.ndarray, factors: tuple[int, int]) -> tuple[np.ndarray, np.ndarray]:
+        """Replaces each (rows, cols) block of factors of the grid by its min and max z point.
+        Output: row lines -> (row blocks, 2*col blocks, 3) array of the points along x
+                column lines -> (col blocks, 2*row blocks, 3) array of the points along y"""
+        fr, fc = factors
+        rows, cols = z.shape
+        pad = ((0, -rows % fr), (0, -cols % fc)) # repeating the edge doesn't change any block's min or max
+        grid = np.stack([np.pad(np.asarray(a, dtype = np.float64), pad, mode = 'edge') for a in (x, y, z)], axis = -1)
+        nr, nc = grid.shape[0]//fr, grid.shape[1]//fc
+        blocks = grid.reshape(nr, fr, nc, fc, 3).transpose(0, 2, 1, 3, 4).reshape(nr, nc, fr*fc, 3)
+        zb = blocks[..., 2]
+        nan = np.isnan(zb)
+        lo = np.where(nan, np.inf, zb).argmin(axis = -1) # in-block index r*fc + c
+        hi = np.where(nan, -np.inf, zb).argmax(axis = -1)
+        def points(first_is_lo): # (nr, nc, 2, 3) of the min and max points, in drawing order
+            first = np.where(first_is_lo, lo, hi)[..., None]
+            second = np.where(first_is_lo, hi, lo)[..., None]
+            order = np.concatenate((first, second), axis = -1)
+            return np.take_along_axis(blocks, order[..., None], axis = 2)
+        along_x = points((lo % fc)*fr + lo//fc <= (hi % fc)*fr + hi//fc) # ordered by column, then row
+        along_y = points(lo <= hi) # ordered by row, then column
+        return along_x.reshape(nr, 2*nc, 3), along_y.transpose(1, 0, 2, 3).reshape(nc, 2*nr, 3)
+
+    def wireframe(self, X: list, Y: list, Z: list, connectors: bool) -> list[list[np.ndarray]]:
+        """Returns the lines to draw for the wireframes of several grids (X[i], Y[i], Z[i]), what
+        ax.plot_wireframe() draws for each of them, decimated to share the budget in proportion to their size.
+        Output: one list of (points, 3) lines per grid"""
+        total = sum(np.size(z) for z in Z)
+        out = []
+        for x, y, z in zip(X, Y, Z):
+            if np.size(z) == 0:
+                out.append([])
+                continue
+            factors = self.factors(np.shape(z), connectors, int(self.segment_budget*np.size(z)/total))
+            if factors == (1, 1):
+                along_x = np.stack((x, y, z), axis = -1) # (rows, cols, 3)
+                along_y = along_x.transpose(1, 0, 2)
+            else:
+                along_x, along_y = self.envelope(x, y, z, factors)
+            out.append(list(along_x) + (list(along_y) if connectors else []))
+        return out
+
+    def default_width(self) -> int:
+        """Width in pixels of a default MatPlotLib figure"""
+        return int(mpl.rcParams['figure.figsize'][0]*mpl.rcParams['figure.dpi'])
+
+    def curves(self, x: np.ndarray, Y: np.ndarray, width: int, key = None, source: np.ndarray = None,
+               version: int = 0) -> tuple[np.ndarray, np.ndarray]:
+        """Decimates the curves (x, Y[i, :]) sharing x, all at once, to the min and max point of each of `width`
+        buckets along x, i.e. of each pixel column. They're placed at the first and last x of the bucket in the
+        order they occur, so the curves keep sharing one x and look the same as the full data.
+        Curves with no more than 2*width points are returned untouched.
+
+        Input:  key -> hashable to cache the result under, e.g. (DataSet, domain, width)
+                source -> the array Y was sliced from. A cached result is only reused while it's the same array
+                version -> the source's File.m_version, which changes when the array is filled in place (e.g. by a LiveReader)
+        Output: (x, Y) decimated"""
+        n = len(x)
+        if self.full_resolution or not width or n <= 2*width:
+            return x, Y
+        cached = self.__curves.get(key) if key is not None else None
+        if cached and cached['source'] is source and cached['version'] == version:
+            return cached['result']
+
+        f = -(-n//width) # points per bucket
+        nb = -(-n//f)
+        Y = np.asarray(Y)
+        blocks = np.pad(Y, ((0, 0), (0, nb*f - n)), mode = 'edge').reshape(len(Y), nb, f)
+        nan = np.isnan(blocks)
+        lo = np.where(nan, np.inf, blocks).argmin(axis = -1)[..., None]
+        hi = np.where(nan, -np.inf, blocks).argmax(axis = -1)[..., None]
+        order = np.where(lo <= hi, np.concatenate((lo, hi), axis = -1), np.concatenate((hi, lo), axis = -1))
+        y = np.take_along_axis(blocks, order, axis = -1).reshape(len(Y), 2*nb)
+        starts = np.arange(nb)*f
+        x = np.column_stack((x[starts], x[np.minimum(starts + f, n) - 1])).ravel()
+        result = (x, y)
+
+        if key is not None:
+            self.__curves[key] = {'source': source, 'version': version, 'result': result}
+            while len(self.__curves) > self.cache_size: # drop the oldest
+                del self.__curves[next(iter(self.__curves))]
+        return result
+
+
+# ==============================================================================
+#               File
+# ==============================================================================
+class File(FileHeader):
+    lod: LevelOfDetail = LevelOfDetail() # decimates the 3D wireframes. Shared with DataBank, so one switch covers every plot
+    cache: ParseCache = None # when set, parsed data is stored in and loaded from this ParseCache
+    compact_grids: bool = False # when True, the independent variables are stored as 1D axes (see __compact_grid())
+    def __init__(self, DataFile: DataFile, lazy: bool = False, dtype = None, run: int = None, archive: tuple = None,
+                 run_rows: tuple = None):
+        """lazy: if True, only the csv's header is read now. The numeric data is loaded
+        the first time it's needed (e.g. by get_data() or a plot method) and can be dropped via release().
+        dtype: storage precision of the data arrays. Defaults to DataFile.dtype
+        run: index of the run to load from a csv holding several runs (see iter_runs()).
+        A lazy File of a run reads that run's header block now, and its DataValue block when it's loaded.
+        archive: (CampaignArchive, entry index) to read the header and data from instead of the csv
+        run_rows: the (header rows, DataValue lines) of the run, if they were already read from the csv"""
+        if archive:
+            self._init_header(DataFile)
+            archive[0].read_header(self, archive[1])
+        elif lazy and run is None:
+            super().__init__(DataFile) # header only
+        elif lazy:
+            self._init_header(DataFile)
+            self.__read_run_header(run, run_rows)
+        else:
+            self._init_header(DataFile)
+        self.m_dtype: np.dtype = np.dtype(DataFile.dtype if dtype is None else dtype)
+        self.m_run: int = run # None unless the csv holds several runs
+        self.m_archive: tuple = archive # None unless the data comes from a CampaignArchive
+        self.m_datadict: dict = {}
+        self.m_loaded: bool = False
+        self.m_axes: dict = {} # header -> (array axis the values vary along, 1D values) for compactly stored variables
+        self.m_slicing: dict = {} # (axis, a, b) -> index bounds, memoized by get_slicing()
+        self.m_version: int = 0 # incremented when the data arrays are changed in place, so caches of them can tell
+        self.__csv_headers: list = [] # the headers whose data came from the csv (as opposed to add_new_data())
+        if not lazy:
+            self.load(run_rows)
+
+    def load(self, run_rows: tuple = None):
+        """Parses the csv's numeric data into m_datadict if it isn't already loaded.
+        Data added since creation (e.g. via DataSet.add_new_data()) is kept.
+        run_rows: the (header rows, DataValue lines) of run m_run, if they were already read from the csv"""
+        if self.m_loaded:
+            return
+        added = [(key, self.m_datadict[key]) for key in self.m_headers if key in self.m_datadict]
+        self.m_headers = []
+        self.m_datadict = {}
+        self.m_axes = {}
+        self.m_slicing = {}
+        if self.m_run is not None: # the cache holds whole csvs, so runs are always parsed
+            self.__process_run(*(run_rows or self.__read_run()))
+            self._process_interval()
+            self.reshape_data()
+            self.__check_missing_dims()
+        elif self.m_archive:
+            self.m_archive[0].read_header(self, self.m_archive[1])
+            self.m_archive[0].read_data(self, self.m_archive[1])
+        elif not (File.cache and File.cache.load(self)):
+            self.__process_csv(self.file_path)
+            self._process_interval()
+            self.reshape_data()
+            self.__check_missing_dims()
+            if File.cache:
+                File.cache.store(self)
+        if File.compact_grids:
+            self.__compact_grid()
+        self.__csv_headers = list(self.m_headers)
+        for key, data in added:
+            self.m_headers.append(key)
+            self.m_datadict[key] = data
+        self.m_loaded = True
+
+    def release(self):
+        """Drops the numeric data loaded from the csv to free up memory.
+        Headers, intervals, and shape are kept, and the data is reloaded the next time it's needed.
+        Files only held in memory (see detach()) have nothing to reload from, so they keep their data."""
+        if self.file_path is None and not self.m_archive:
+            return
+        for key in self.__csv_headers:
+            self.m_datadict.pop(key, None)
+        self.m_axes = {}
+        self.m_slicing = {}
+        self.m_loaded = False
+
+    def detach(self):
+        """Cuts the File off from its csv (or archive), so its data is only held in memory: it's never reloaded
+        or released. For Files built from the data of others, like the aggregates of DataBank.groupby()."""
+        self.file_path = None
+        self.m_run = None
+        self.m_archive = None
+        self.m_intervals_info = {name: dict(info) for name, info in self.m_intervals_info.items()}
+        self.__csv_headers = []
+        self.m_loaded = True
+
+    def __getstate__(self):
+        # compactly stored variables are pickled as their 1D axes instead of full size copies of the views
+        state = self.__dict__.copy()
+        state['m_datadict'] = {key: data for key, data in self.m_datadict.items() if key not in self.m_axes}
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        for key in self.m_axes:
+            self.m_datadict[key] = self.__broadcast(key)
+
+    def __broadcast(self, key: str) -> np.ndarray:
+        '''Returns a read-only 2D view of the 1D axis stored for key, with the shape of the data arrays.'''
+        axis, values = self.m_axes[key]
+        if axis == 1: # values change from column to column, like x
+            return np.broadcast_to(values, self.m_shape)
+        return np.broadcast_to(values[:, np.newaxis], self.m_shape) # values change from row to row, like y
+
+    def __compact_grid(self):
+        '''Replaces the 2D arrays of the independent variables with 1D axes and read-only broadcast views of them,
+        as long as every row (for x) or column (for y) of the 2D array holds the same values.
+        Arrays that don't follow the grid (e.g. a truncated sweep padded with zeros) are left as they are.'''
+        for key, axis in [(self.m_headers[0], 1), (self.m_headers[1], 0)]:
+            if key in self.m_axes:
+                continue
+            data = self.m_datadict[key]
+            self.m_axes[key] = (axis, np.array(data[0, :] if axis == 1 else data[:, 0]))
+            view = self.__broadcast(key)
+            if np.array_equal(view, data):
+                self.m_datadict[key] = view
             else:
-                keys[0] = interval_keys[i] # set keys[0] to the present key
-        if keys[1]: # if there was an interval key that was missing from the headers keys
+                del self.m_axes[key]
+
+
+    def __process_csv(self, input_file):
+        '''Scrapes all pertinent data from the easyEXPERT csv into the File object.
+        The DataValue block is decoded in bulk; malformed files fall back to the row-by-row parser.'''
+        try:
+            self.__process_csv_bulk(input_file)
+        except (ValueError, IndexError, KeyError, AttributeError):
+            # start over from a clean slate so the row parser sees the same state as a fresh File
+            self.m_headers = []
+            self.m_datadict = {}
+            self.__process_csv_rows(input_file)
+        self.m_shape = (self.m_dim2_count, self.m_dim1_count)
+
+    def __process_csv_bulk(self, input_file):
+        '''Parses the header rows one at a time, then decodes the whole DataValue block with a single
+        numpy call straight into the preallocated data arrays.
+        Raises ValueError if the DataValue block is not a clean (rows x headers) block of numbers.'''
+        with open(input_file, 'r') as csvfile:
+            if not self._read_header(csvfile):
+                raise ValueError(f"No DataName row found in {input_file}")
+            self.__allocate_data()
+            block = csvfile.read().strip()
+        self.__decode_block(block, input_file)
+
+    def __decode_block(self, block: str, source: str):
+        '''Decodes a block of DataValue rows with a single numpy call into the allocated data arrays.
+        Raises ValueError if the block is not a clean (rows x headers) block of numbers.'''
+        if not block: # no data was recorded
+            return
+        row_count = block.count('\n') + 1
+        if block.count('DataValue') != row_count or row_count > self.m_dim1_count * self.m_dim2_count:
+            raise ValueError(f"Unexpected rows in the DataValue block of {source}")
+
+        col_count = len(self.m_headers)
+        values = np.loadtxt(block.splitlines(), delimiter = ',', comments = None,
+                            usecols = range(1, col_count+1), ndmin = 2)
+        if values.shape != (row_count, col_count):
+            raise ValueError(f"DataValue block of {source} has shape {values.shape}, expected {(row_count, col_count)}")
+        for i, header in enumerate(self.m_headers):
+            self.m_datadict[header][:row_count] = values[:, i]
+
+    def __read_run_header(self, run: int, run_rows: tuple = None):
+        '''Reads the header block of run from the csv (or from run_rows), stopping before its DataValue rows'''
+        if run_rows is None:
+            with open(self.file_path, 'r') as csvfile:
+                for k, run_rows in enumerate(_split_runs(csvfile, headers_of = run)):
+                    if k == run:
+                        break
+                else:
+                    raise IndexError(f"{self.file_path} has no run {run}")
+        for row in run_rows[0]:
+            self._process_header_row(row)
+        self._process_interval()
+        self._check_missing_headers()
+        self.m_shape = (self.m_dim2_count, self.m_dim1_count)
+
+    def __read_run(self) -> tuple[list, list]:
+        '''Reads the rows of run m_run from the csv'''
+        with open(self.file_path, 'r') as csvfile:
+            for run, run_rows in enumerate(_split_runs(csvfile)):
+                if run == self.m_run:
+                    return run_rows
+        raise IndexError(f"{self.file_path} has no run {self.m_run}")
+
+    def __process_run(self, header_rows: list, value_lines: list):
+        '''Parses one run of a multi-run csv, given its header rows and its DataValue lines (see _split_runs())'''
+        for row in header_rows:
+            self._process_header_row(row)
+        self.__allocate_data()
+        try:
+            self.__decode_block(''.join(value_lines).strip(), f"run {self.m_run} of {self.file_path}")
+        except ValueError: # fall back to decoding the rows one at a time
+            for data_idx, row in enumerate(csvreader(value_lines, delimiter = ',')):
+                for i, v in enumerate(row[1:]):
+                    self.m_datadict[self.m_headers[i]][data_idx] = float(v)
+        self.m_shape = (self.m_dim2_count, self.m_dim1_count)
+
+    def __process_csv_rows(self, input_file):
+        '''Row-by-row parser. Slow, but tolerant of files the bulk parser rejects.'''
+        with open(input_file, 'r') as csvfile:
+            reader = csvreader(csvfile, delimiter = ',') # change contents to floats
+            data_idx = 0 # data row index -- which row in specifically the numerical data columns we're at
+            for row in reader: # each row is a list
+                if row and row[0].strip() == 'DataValue': # this inserts data into the appropriate data array spots
+                    for i, v in enumerate(row):
+                        if i == 0:
+                            continue
+                        self.m_datadict[self.m_headers[i-1]][data_idx] = float(v)
+                    data_idx += 1
+                elif data_idx and row: # header rows after the data: a second run starts here
+                    print(f"'{input_file}' holds several runs, only the first was loaded. Use iter_runs() to load all of them.")
+                    break
+                elif self._process_header_row(row): # DataName row
+                    self.__allocate_data()
+
+    def __allocate_data(self):
+        '''Allocates appropriately-sized numpy arrays for the data of each header'''
+        for header in self.m_headers:
+            self.m_datadict[header] = np.zeros( self.m_dim1_count * self.m_dim2_count, dtype = self.m_dtype )
+
+    def __check_missing_dims(self):
+        """This function checks to see if there are independent variables NOT in m_datadict.
+        If missing variables are found, then a 2D numpy array is created via the meshgrid."""
+        missing_key = self._check_missing_headers() # adds the missing key to m_headers as the 2nd independent variable
+        if missing_key: # if there was an interval key that was missing from the headers keys
             # create the missing 2D array that would go with the missing independent variable using a meshgrid
-            x, y = np.meshgrid(self.m_intervals[interval_keys[0]], self.m_intervals[interval_keys[1]])
-            # and add it to the m_headers as the 2nd independent variable
-            self.m_headers.insert(1, keys[1])
-            self.m_datadict[keys[1]] = y
+            interval_keys = list(self.m_intervals.keys())
+            y_values = self.m_intervals[interval_keys[1]]
+            if File.compact_grids and len(y_values) == self.m_shape[0]: # no need for the full meshgrid
+                self.m_axes[missing_key] = (0, np.asarray(y_values, dtype = self.m_dtype))
+                self.m_datadict[missing_key] = self.__broadcast(missing_key)
+                return
+            x, y = np.meshgrid(self.m_intervals[interval_keys[0]], y_values)
+            self.m_datadict[missing_key] = y.astype(self.m_dtype, copy = False)
     
     def swap_x_and_y(self):
         """Untested function, beware. It is supposed flip data along the x = y line."""
@@ -224,10 +1010,7 @@ class File:
         fig, ax1 = plt.subplots(
             1, 1, #figsize = (12, 18),
             subplot_kw={'projection': '3d'})
-        if connectors:
-            ax1.plot_wireframe(x, y, z, rcount=self.m_dim2_count, ccount=self.m_dim1_count)#cstride=file.m_dim2_count)
-        else:
-            ax1.plot_wireframe(x, y, z, rcount=self.m_dim2_count, ccount=0)#cstride=file.m_dim2_count)
+        self.draw_wireframe(ax1, x, y, z, connectors)
     
         ax1.set_xlabel(self.get_data_name(0))
         ax1.set_ylabel(self.get_data_name(1))
@@ -248,10 +1031,7 @@ class File:
         fig, ax1 = plt.subplots(
             1, 1, figsize = (12, 18),
             subplot_kw={'projection': '3d'})
-        if connectors:
-            ax1.plot_wireframe(X, Y, Z, rcount=self.m_dim2_count, ccount=self.m_dim1_count)#cstride=file.m_dim2_count)
-        else:
-            ax1.plot_wireframe(X, Y, Z, rcount=self.m_dim2_count, ccount=0)#cstride=file.m_dim2_count)
+        self.draw_wireframe(ax1, X, Y, Z, connectors)
     
         ax1.set_xlabel(self.get_data_name(0))
         ax1.set_ylabel(self.get_data_name(1))
@@ -259,49 +1039,63 @@ class File:
         ax1.set_title(self.get_title())
         plt.show()
 
+    def draw_wireframe(self, ax, X, Y, Z, connectors: bool, color = None):
+        """Draws what ax.plot_wireframe(X, Y, Z) draws, as one Line3DCollection decimated by File.lod.
+        connectors: also draw the lines along the columns (y), not only along the rows (x)"""
+        lines = File.lod.wireframe([X], [Y], [Z], connectors)[0]
+        ax.add_collection3d(art3d.Line3DCollection(lines, colors = color if color is not None else 'C0'))
+        ax.auto_scale_xyz(X, Y, Z, had_data = False)
+
     def get_data(self, index: int):
+        if not self.m_loaded: # lazy File or released data
+            self.load()
         return self.m_datadict[self.m_headers[index]]
     
-    def get_data_name(self, index: int):
-        return self.m_headers[index]
-    
-    def get_headers(self):
-        return self.m_headers
-    
-    def get_interval(self, index: int):
-        return self.m_intervals[self.m_headers[index]]
-    
-    def get_interval_name(self, index: int) -> str:
-        return self.m_intervals.keys()[self.m_headers[index]]
-    
-    def get_title(self):
-        """Returns m_title"""
-        return self.m_title
-    
-    def get_interval_info(self, index: int) -> dict:
-        """Returns the interval_info of the data at index specified."""
-        return self.m_intervals_info[self.m_headers[index]]
-    
     def get_slicing(self, axis, domain: list[float, float]) -> tuple[int, int]:
         """Returns a tuple for index slicing to reduce the x or y axis to the domain [a, b] via x[:, a:b] or y[a:b, :]
+        Results are memoized per domain until reset_slicing() is called.
         
         Input:  axis ->'x' or 0 or 'y' or 1 to select axis
                 domain -> [a, b] to restrict given axis to
                 
         Ouptut: tuple for index slicing of form (a, b)"""
         if axis == 0 or axis == 'x':
-            xdom = domain
-            x = self.get_data(0)
-            cols = (np.searchsorted(x[0,:], xdom[0]),    np.searchsorted(x[0, :], xdom[1], side='right'))
-            return cols
+            axis = 0
         elif axis == 1 or axis == 'y':
-            ydom = domain
-            y = self.get_data(1)
-            rows = (np.searchsorted(y[:, 0], ydom[0]),    np.searchsorted(y[:, 0], ydom[1], side='right'))
-            return rows
+            axis = 1
         else:
             print("Invalid axis selection. Enter either the axis index or character (ei. 'x' or 0; 'y' or 1)")
             return None
+        key = (axis, domain[0], domain[1])
+        if key not in self.m_slicing:
+            values = self.get_data(0)[0, :] if axis == 0 else self.get_data(1)[:, 0]
+            self.m_slicing[key] = (self.__search(values, axis, domain[0], 'left'),
+                                   self.__search(values, axis, domain[1], 'right'))
+        return self.m_slicing[key]
+
+    def reset_slicing(self):
+        """Clears the memoized results of get_slicing(). Needed if the x or y data is changed in place."""
+        self.m_slicing = {}
+
+    def __search(self, values: np.ndarray, axis: int, value: float, side: str) -> int:
+        '''Same as np.searchsorted(values, value, side), but computed in O(1) from the start and step of the axis'
+        interval when the sweep is an evenly spaced, increasing grid.'''
+        count = len(values)
+        if value == -float('inf'):
+            return 0
+        if value == float('inf'):
+            return count
+        info = list(self.m_intervals_info.values())[axis] # the 1st interval goes with x, the 2nd with y
+        if info['step'] > 0:
+            guess = int(np.clip(np.ceil((value - info['start']) / info['step']), 0, count))
+            for _ in range(3): # rounding may put the guess a step or so off the exact answer
+                if guess > 0 and (values[guess-1] >= value if side == 'left' else values[guess-1] > value):
+                    guess -= 1
+                elif guess < count and (values[guess] < value if side == 'left' else values[guess] <= value):
+                    guess += 1
+                else:
+                    return guess
+        return int(np.searchsorted(values, value, side = side))
         
         """
         For the proper index slicing, x values vary column to column, so you need to hold the row constant
@@ -375,15 +1169,73 @@ class DataInfo:
         return copy
 
 
+# ==============================================================================
+#               DeviceRegistry
+# ==============================================================================
+class DeviceRegistry:
+    def __init__(self, path: str = None, check_interval: float = 1.0):
+        """Index of the devices listed in a devices.json file, shared by every DataSet.
+        The file is only read on first use, and is re-read only if its modification time changes.
+
+        Input:  path -> path to the devices.json. Defaults to 'devices.json' in the working directory at first use
+                        if there is one, otherwise the one next to this module.
+                check_interval -> minimum number of seconds between checks of the file's modification time"""
+        self.path: Path = Path(path).resolve() if path else None # resolved so that changing directories later doesn't matter
+        self.check_interval = check_interval
+        self.devices: list[dict] = []
+        self.by_number: dict[int, dict] = {}
+        self.by_serial_number: dict[str, dict] = {}
+        self.__mtime = None
+        self.__last_check = -float('inf')
+
+    def reload(self):
+        """Re-reads the devices file and rebuilds the indices"""
+        if self.path is None:
+            path = 'devices.json' if os.path.exists('devices.json') else Path(__file__).parent / 'devices.json'
+            self.path = Path(path).resolve()
+        mtime = os.stat(self.path).st_mtime_ns
+        with open(self.path, 'r') as f:
+            self.devices = jsonload(f)['devices']
+        self.by_number = {device['number']: device for device in self.devices}
+        self.by_serial_number = {device['serial_number']: device for device in self.devices if 'serial_number' in device}
+        self.__mtime = mtime
+
+    def __refresh(self):
+        '''Reloads the devices file if it's never been loaded or has changed since it was'''
+        now = monotonic()
+        if self.__mtime is not None and now - self.__last_check < self.check_interval:
+            return
+        self.__last_check = now
+        if self.__mtime is None or os.stat(self.path).st_mtime_ns != self.__mtime:
+            self.reload()
+
+    def get(self, number: int = None, serial_number: str = None) -> dict:
+        """Returns the device's entry by its number or serial number, or None if it isn't listed"""
+        self.__refresh()
+        if number is not None:
+            return self.by_number.get(number)
+        return self.by_serial_number.get(serial_number)
+
+
 # ==============================================================================
 #               DataSet
 # ==============================================================================
 class DataSet(File):
+    devices = DeviceRegistry() # device info looked up by the device number in the file code
     instance_count = 0
     markers = ['.', '3', '*', '4', 'v', 'o']
     colorblind = True # uses the IBM color pallete for colorblindness
-    def __init__(self, DataFile: DataFile):
-        super().__init__(DataFile)
+    def __init__(self, DataFile: DataFile, lazy: bool = False, parsed: File = None, dtype = None, run: int = None,
+                 archive: tuple = None):
+        """lazy: only read the csv header now and load the data on first use (see File)
+        parsed: an already-parsed File of this DataFile to build from instead of parsing the csv again
+        dtype: storage precision of the data arrays (see File)
+        run: index of the run to load from a csv holding several runs (see File and iter_runs())
+        archive: (CampaignArchive, entry index) to load from instead of the csv (see DataBank.load_archive())"""
+        if parsed:
+            self.__dict__.update(parsed.__dict__)
+        else:
+            super().__init__(DataFile, lazy, dtype, run, archive)
         self.Info = DataInfo()
         self.ln_style:str  = '-'
         self.marker: str
@@ -525,20 +1377,15 @@ class DataSet(File):
 
     
     def __parse_device_number(self, transistor_number: str):
-        f = open('devices.json') # Opening JSON file containing device info
-        data = jsonload(f) # returns JSON object as a dictionary using JSON import
-
         tnum = int(transistor_number) # device number we'll be looking for
-        unknown_device: bool = True
-        for device in data['devices']: # Iterating through the JSON list of devices
-            if device['number'] == tnum: # if we find the right device, we set fill in its info
-                unknown_device = False
-                self.Info.device_number = device['number']
-                self.Info.chan_dims['len'] = device['length']
-                self.Info.chan_dims['wid'] = device['width']
-                self.Info.chan_dims['area'] = device['area']
-                self.Info.device_model = device['model']
-        if unknown_device: # if the device isn't listed
+        device = DataSet.devices.get(number = tnum) # indexed lookup into devices.json
+        if device: # if we find the right device, we set fill in its info
+            self.Info.device_number = device['number']
+            self.Info.chan_dims['len'] = device['length']
+            self.Info.chan_dims['wid'] = device['width']
+            self.Info.chan_dims['area'] = device['area']
+            self.Info.device_model = device['model']
+        else: # if the device isn't listed
                 print(" Adding device not listed in 'devices.json'...")
                 print("  Is your test code right or are you testing an unlisted device?")
                 self.Info.device_number = None
@@ -546,7 +1393,6 @@ class DataSet(File):
                 self.Info.chan_dims['wid'] = "unknown"
                 self.Info.chan_dims['area'] = "unknown"
                 self.Info.device_model = "unknown"
-        f.close() # close JSON file
 
     def add_new_data(self, zlabel: str, z:np.array):
         """Appends a new 2D independent variable array to this DataSet's m_datadict if the dimensions match"""
@@ -576,10 +1422,7 @@ class DataSet(File):
         fig, ax1 = plt.subplots(
             1, 1, #figsize = (12, 18),
             subplot_kw={'projection': '3d'})
-        if connectors:
-            ax1.plot_wireframe(x, y, z, rcount=self.m_dim2_count, ccount=self.m_dim1_count, color = self.color)#cstride=file.m_dim2_count)
-        else:
-            ax1.plot_wireframe(x, y, z, rcount=self.m_dim2_count, ccount=0, color = self.color)#cstride=file.m_dim2_count)
+        self.draw_wireframe(ax1, x, y, z, connectors, self.color)
     
         ax1.set_xlabel(self.get_data_name(0))
         ax1.set_ylabel(self.get_data_name(1))
@@ -719,10 +1562,474 @@ class DataSet(File):
                 self.Info.data_name = data_name
 
 
+# ==============================================================================
+#               Campaign loading
+# ==============================================================================
+class LoadReport:
+    def __init__(self, count: int):
+        '''Report of a load_campaign() call. Indices refer to positions in the list of DataFiles that was loaded.'''
+        self.count = count
+        self.timings: list[float] = [None] * count # seconds spent parsing each file, None if it failed
+        self.failures: list[dict] = [] # {'index', 'file_code', 'file_path', 'error'} of each file that failed
+        self.total_time: float = 0
+
+    def add_failure(self, index: int, DataFile: DataFile, error):
+        self.failures.append({'index': index,
+                              'file_code': DataFile.file_code,
+                              'file_path': DataFile.file_path,
+                              'error': f"{type(error).__name__}: {error}"})
+        self.timings[index] = None
+
+    def print(self):
+        print(f"Loaded {self.count - len(self.failures)}/{self.count} files in {self.total_time:.2f} s")
+        for i, seconds in enumerate(self.timings):
+            if seconds is not None:
+                print(f"   {i}\t {seconds:.3f} s")
+        for failure in sorted(self.failures, key = lambda f: f['index']):
+            print(f"   {failure['index']}\t FAILED {failure['file_code']} ({failure['file_path']}): {failure['error']}")
+
+
+def _parse_in_worker(DataFile: DataFile, cache: ParseCache, compact_grids: bool, dtype):
+    '''Parses a single csv in a worker process. Returns the parsed File and the time it took.'''
+    File.cache = cache # class attributes aren't carried over to spawned worker processes
+    File.compact_grids = compact_grids
+    start = perf_counter()
+    parsed = File(DataFile, dtype = dtype)
+    return parsed, perf_counter() - start
+
+
+def _run_pool(DataFiles: list[DataFile], indices: list[int], workers: int, parsed: list, report: LoadReport, dtype = None) -> list[int]:
+    '''Parses DataFiles[indices] in a process pool, filling in parsed and report.
+    Returns the indices that were lost because a worker process died.'''
+    lost = []
+    with ProcessPoolExecutor(max_workers = workers) as pool:
+        futures = {pool.submit(_parse_in_worker, DataFiles[i], File.cache, File.compact_grids, dtype): i for i in indices}
+        for future in as_completed(futures):
+            i = futures[future]
+            try:
+                parsed[i], report.timings[i] = future.result()
+            except BrokenProcessPool:
+                lost.append(i)
+            except Exception as err:
+                report.add_failure(i, DataFiles[i], err)
+    return lost
+
+
+def load_campaign(DataFiles: list[DataFile], workers: int = None, dtype = None) -> tuple[list[DataSet], LoadReport]:
+    """Parses a list of DataFiles in parallel using a pool of worker processes.
+    A file that fails to parse (e.g. a truncated export) is skipped and reported instead of stopping the run.
+    If a worker process crashes, the files it took down are retried one at a time, so only the file that
+    caused the crash is lost.
+    
+    Note: on Windows and macOS, scripts calling this need an `if __name__ == '__main__':` guard.
+
+    Input:  DataFiles -> list of DataFiles to load
+            workers -> number of worker processes. Defaults to the number of CPUs
+            dtype -> storage precision for every file's data (e.g. np.float32). Defaults to each DataFile's dtype
+
+    Output: the successfully loaded DataSets in input order, and a LoadReport of timings and failures"""
+    start = perf_counter()
+    report = LoadReport(len(DataFiles))
+    parsed = [None] * len(DataFiles)
+
+    lost = _run_pool(DataFiles, range(len(DataFiles)), workers, parsed, report, dtype)
+    for i in lost: # a worker died, so retry each of its files in its own process to find the culprit
+        if _run_pool(DataFiles, [i], 1, parsed, report, dtype):
+            report.add_failure(i, DataFiles[i], BrokenProcessPool("worker process crashed while parsing"))
+
+    # DataSets are built here, in order, so colors and markers match a serial load
+    Sets = []
+    for i, F in enumerate(parsed):
+        if F is None:
+            continue
+        try:
+            Sets.append(DataSet(DataFiles[i], parsed = F))
+        except Exception as err:
+            report.add_failure(i, DataFiles[i], err)
+    report.total_time = perf_counter() - start
+    return Sets, report
+
+
+def _split_runs(csvfile, headers_of: int = None):
+    '''Splits an open easyEXPERT csv into its runs in a single pass.
+    Yields the (header rows, DataValue lines) of each SetupTitle...DataValue block.
+    headers_of: index of a run to stop at once its header block is read, yielding it without DataValue lines'''
+    header_rows, value_lines = [], []
+    has_setup = False
+    run = 0
+    for line in csvfile:
+        if line.lstrip().startswith('DataValue'):
+            value_lines.append(line)
+            continue
+        row = next(csvreader([line], delimiter = ','), [])
+        if not row:
+            continue
+        starts_run = row[0].strip() == 'SetupTitle'
+        if value_lines or (starts_run and has_setup): # the previous run is complete
+            yield header_rows, value_lines
+            header_rows, value_lines = [], []
+            has_setup = False
+            run += 1
+        has_setup = has_setup or starts_run
+        header_rows.append(row)
+        if run == headers_of and row[0].strip() == 'DataName': # DataValue rows come next
+            yield header_rows, []
+            return
+    if header_rows or value_lines:
+        yield header_rows, value_lines
+
+
+def iter_runs(DataFile: DataFile, dtype = None):
+    """Reads an easyEXPERT csv that holds several runs (repeated SetupTitle...DataValue blocks) in a single pass,
+    yielding one DataSet per run as soon as it has been read. Each DataSet has its own intervals and Info,
+    and its data_name is the file code followed by the run index. Runs that can't be parsed are skipped with a message.
+
+    Input:  DataFile -> the DataFile of the multi-run csv
+            dtype -> storage precision of the data arrays. Defaults to DataFile.dtype
+
+    Output: generator of DataSets, in the order the runs appear in the csv"""
+    with open(DataFile.file_path, 'r') as csvfile:
+        for run, run_rows in enumerate(_split_runs(csvfile)):
+            try:
+                parsed = File(DataFile, dtype = dtype, run = run, run_rows = run_rows)
+            except (ValueError, IndexError, KeyError, AttributeError, TypeError) as err:
+                print(f"Skipping run {run} of '{DataFile.file_path}': could not parse it ({err})")
+                continue
+            Set = DataSet(DataFile, parsed = parsed)
+            Set.Info.data_name = f"{DataFile.file_code} run {run}"
+            yield Set
+
+
+# ==============================================================================
+#               Live acquisition
+# ==============================================================================
+class LiveReader:
+    def __init__(self, DataFile: DataFile, source = None, dtype = None, timeout: float = 10.0, poll_interval: float = 0.05):
+        """Incrementally parses an easyEXPERT csv while the sweep is still running.
+        The header is parsed like any other File's, then the data arrays of the DataSet (self.Set) are allocated
+        and filled in place by update() as DataValue rows arrive.
+
+        Input:  DataFile -> the DataFile of the sweep. Its path is the csv being written, unless a source is given
+                source -> file-like object to read the csv from instead, e.g. a pipe or socket.makefile('r').
+                    Reaching its end means the sweep is over, whereas a csv file is waited on until it's complete
+                dtype -> storage precision of the data arrays. Defaults to DataFile.dtype
+                timeout -> seconds to wait for the whole header to arrive before giving up
+                poll_interval -> seconds between checks of a csv file for new rows"""
+        self.poll_interval = poll_interval
+        self.rows_read: int = 0
+        self.__is_stream = source is not None
+        deadline = monotonic() + timeout
+        while not (self.__is_stream or os.path.exists(DataFile.file_path) or monotonic() > deadline):
+            sleep(poll_interval) # the sweep may not have started writing its csv yet
+        self.__source = source if self.__is_stream else open(DataFile.file_path, 'r')
+        self.__lines = Queue() # complete lines, filled by a background thread so update() never blocks
+        self.__ended = False
+        self.__closed = False
+        Thread(target = self.__pump, daemon = True).start()
+
+        header_rows = []
+        while not (header_rows and header_rows[-1][0].strip() == 'DataName'):
+            try:
+                line = self.__lines.get(timeout = timeout)
+            except Empty:
+                self.close()
+                raise TimeoutError(f"Timed out waiting for the header of {DataFile.file_path}")
+            if line is None or line.lstrip().startswith('DataValue'):
+                self.close()
+                raise ValueError(f"No DataName row found in {DataFile.file_path}")
+            row = next(csvreader([line], delimiter = ','), [])
+            if row:
+                header_rows.append(row)
+        self.columns: list[str] = [header.strip() for header in header_rows[-1][1:]] # csv column order
+
+        parsed = File(DataFile, dtype = dtype, run = 0, run_rows = (header_rows, [])) # header only, so the arrays are allocated but empty
+        for header in self.columns: # these are filled in place, so they can't be compact (read-only) views
+            if header in parsed.m_axes:
+                del parsed.m_axes[header]
+                parsed.m_datadict[header] = np.zeros(parsed.m_shape, dtype = parsed.m_dtype)
+        self.Set: DataSet = DataSet(DataFile, parsed = parsed)
+        self.row_count: int = parsed.m_dim1_count * parsed.m_dim2_count
+        self.__flat = [self.Set.m_datadict[header].reshape(-1) for header in self.columns] # views, not copies
+
+    def __pump(self):
+        '''Runs in a background thread, moving complete lines from the source into the queue.'''
+        partial = ''
+        while not self.__closed:
+            try:
+                line = self.__source.readline()
+            except (OSError, ValueError): # the source was closed
+                break
+            if not line:
+                if self.__is_stream: # end of the stream
+                    break
+                sleep(self.poll_interval) # the csv may still grow
+                continue
+            partial += line
+            if partial.endswith('\n'): # otherwise the writer is midway through the line
+                self.__lines.put(partial)
+                partial = ''
+        if partial:
+            self.__lines.put(partial)
+        self.__lines.put(None)
+
+    def feed(self, lines: list[str]) -> int:
+        """Writes DataValue rows into the DataSet's arrays in place. Other lines are ignored.
+        This is used by update(), but can also be given rows received some other way.
+        Malformed rows are stored as NaN, so the rows after them still land on their own grid points.
+        Returns the number of rows written."""
+        lines = [line for line in lines if line.lstrip().startswith('DataValue')]
+        space = self.row_count - self.rows_read
+        if len(lines) > space:
+            print(f"{len(lines) - space} DataValue rows beyond the end of the sweep were ignored")
+            lines = lines[:space]
+        if not lines:
+            return 0
+        try:
+            values = np.loadtxt(lines, delimiter = ',', comments = None, usecols = range(1, len(self.columns)+1), ndmin = 2)
+        except ValueError: # decode the rows one at a time. Malformed ones become NaN, so later rows keep their grid slots
+            values = np.full((len(lines), len(self.columns)), np.nan)
+            for k, line in enumerate(lines):
+                fields = line.split(',')[1:]
+                try:
+                    if len(fields) < len(self.columns) or any(v.strip() for v in fields[len(self.columns):]):
+                        raise ValueError(f"expected {len(self.columns)} values")
+                    values[k] = [float(v) for v in fields[:len(self.columns)]]
+                except ValueError:
+                    print(f"Malformed row stored as NaN: {line.strip()}")
+        start, stop = self.rows_read, self.rows_read + len(values)
+        for i, flat in enumerate(self.__flat):
+            flat[start:stop] = values[:, i]
+        self.rows_read = stop
+        self.Set.reset_slicing() # x and y changed in place
+        self.Set.m_version += 1
+        return len(values)
+
+    def update(self) -> int:
+        """Reads every row that has arrived since the last update without waiting for more.
+        Returns the number of new rows."""
+        lines = []
+        while True:
+            try:
+                line = self.__lines.get_nowait()
+            except Empty:
+                break
+            if line is None:
+                self.__ended = True
+                break
+            lines.append(line)
+        new_rows = self.feed(lines)
+        if self.complete:
+            self.close()
+        return new_rows
+
+    @property
+    def progress(self) -> float:
+        '''Fraction of the sweep's points that have been read'''
+        return self.rows_read / self.row_count if self.row_count else 1.0
+
+    @property
+    def complete(self) -> bool:
+        '''True once every point of the sweep has been read, or the stream has ended'''
+        return self.rows_read >= self.row_count or self.__ended
+
+    def print(self):
+        print(f"{self.Set.Info.data_name}: {100*self.progress:.1f}% of the sweep read ({self.rows_read}/{self.row_count} points)")
+
+    def close(self):
+        """Stops reading. A csv file opened by the LiveReader is closed, a given source is left open."""
+        self.__closed = True
+        if not self.__is_stream:
+            self.__source.close()
+
+
+class InstrumentEmulator:
+    def __init__(self, csv_path: str, rate: float = 100.0):
+        """Replays an existing easyEXPERT csv as if the instrument were still sweeping, for trying out live mode.
+        The header is sent at once, followed by the DataValue rows at the given rate.
+
+        Input:  csv_path -> the csv to replay
+                rate -> DataValue rows per second"""
+        with open(csv_path, 'r') as csvfile:
+            lines = csvfile.readlines()
+        first = next((i for i, line in enumerate(lines) if line.lstrip().startswith('DataValue')), len(lines))
+        self.header: list[str] = lines[:first]
+        self.rows: list[str] = lines[first:]
+        if self.rows and not self.rows[-1].endswith('\n'):
+            self.rows[-1] += '\n'
+        self.rate = rate
+        self.__stop = Event()
+        self.__thread: Thread = None
+        self.__server: socket = None
+
+    def __replay(self, write, flush):
+        write(''.join(self.header))
+        flush()
+        start = perf_counter()
+        for i, row in enumerate(self.rows):
+            delay = start + i / self.rate - perf_counter()
+            if self.__stop.wait(max(delay, 0)):
+                break
+            write(row)
+            flush()
+
+    def __replay_to_file(self, output_path: str):
+        with open(output_path, 'w') as out:
+            self.__replay(out.write, out.flush)
+
+    def __serve(self):
+        try:
+            connection, _ = self.__server.accept()
+        except OSError: # stopped before anyone connected
+            return
+        with connection, connection.makefile('w') as out:
+            try:
+                self.__replay(out.write, out.flush)
+            except OSError: # the reader disconnected
+                pass
+        self.__server.close()
+
+    def start_file(self, output_path: str):
+        """Starts writing the csv to output_path in the background, as easyEXPERT would during a sweep."""
+        self.__stop.clear()
+        self.__thread = Thread(target = self.__replay_to_file, args = (output_path,), daemon = True)
+        self.__thread.start()
+
+    def start_socket(self, host: str = '127.0.0.1', port: int = 0) -> tuple[str, int]:
+        """Serves the csv to the first client that connects to a local socket, in the background.
+        Returns the (host, port) to connect to. Port 0 picks a free port."""
+        self.__stop.clear()
+        self.__server = create_server((host, port))
+        self.__thread = Thread(target = self.__serve, daemon = True)
+        self.__thread.start()
+        return self.__server.getsockname()[:2]
+
+    def join(self, timeout: float = None):
+        """Waits for the replay to finish."""
+        if self.__thread:
+            self.__thread.join(timeout)
+
+    def stop(self):
+        """Stops the replay early."""
+        self.__stop.set()
+        if self.__server:
+            self.__server.close()
+        self.join()
+
+
+# ==============================================================================
+#               Regridding
+# ==============================================================================
+def sweep_grid(Set: File) -> tuple:
+    """The uniform sweep grid of a File/DataSet. The counts come from the shape of its data, since the counts in
+    m_intervals_info are derived from the step and can be off by one from float rounding. The start/step come from
+    m_intervals_info when they agree with the x/y data, otherwise from the data.
+    Output: ((x start, x step, x count), (y start, y step, y count))"""
+    info = list(Set.m_intervals_info.values()) # the 1st interval goes with x, the 2nd with y
+    x, y = Set.get_data(0)[0, :], Set.get_data(1)[:, 0]
+    grid = []
+    for values, i in zip((x, y), info):
+        count = len(values)
+        start, step = float(i['start']), float(i['step'])
+        first, last = float(values[0]), float(values[-1])
+        scale = max(abs(first), abs(last), abs(step)*count, 1e-300)
+        if abs(start - first) > 1e-6*scale or abs(start + step*(count - 1) - last) > 1e-6*scale:
+            start, step = first, (last - first)/(count - 1) if count > 1 else step
+        grid.append((start, step, count))
+    return tuple(grid)
+
+def common_grid(Sets: list[File], mode: str = 'intersection') -> tuple:
+    """A uniform grid every File/DataSet in Sets can be interpolated onto, using the finest step among them.
+    Input:  mode -> 'intersection' to only cover the range all of them were swept over,
+                    'union' to cover the range any of them was swept over (points outside a set's sweep become NaN)
+    Output: grid in the form of sweep_grid(), or None if the sweeps don't overlap"""
+    if mode not in ('intersection', 'union'):
+        raise Exception("Error: invalid mode selected. Pick from 'intersection' or 'union'")
+    grids = [sweep_grid(S) for S in Sets]
+    out = []
+    for axis in range(2):
+        ranges = [sorted((start, start + step*(count - 1))) for start, step, count in (g[axis] for g in grids)]
+        steps = [abs(g[axis][1]) for g in grids if g[axis][2] > 1]
+        step = min(steps) if steps else 0.0
+        if mode == 'intersection':
+            lo, hi = max(r[0] for r in ranges), min(r[1] for r in ranges)
+        else:
+            lo, hi = min(r[0] for r in ranges), max(r[1] for r in ranges)
+        if hi < lo:
+            print(f"The sweeps of the {'xy'[axis]} axis don't overlap, there's no common grid")
+            return None
+        count = int(round((hi - lo)/step)) + 1 if step else 1
+        out.append((lo, step, count))
+    return tuple(out)
+
+def grid_values(grid: tuple) -> tuple[np.ndarray, np.ndarray]:
+    """The x and y values of a grid in the form of sweep_grid()"""
+    return tuple(start + step*np.arange(count) for start, step, count in grid)
+
+class Regridder:
+    def __init__(self, max_pairs: int = 256):
+        """Bilinear interpolation of DataSets onto other uniform sweep grids.
+        The interpolation weights only depend on the source and target grids, so they're computed once per
+        grid pair and cached, and every array swept on the same grid reuses them.
+
+        Input:  max_pairs -> number of grid pairs to keep weights for"""
+        self.max_pairs = max_pairs
+        self.__weights: dict = {} # (source grid, target grid) -> weights, see weights()
+
+    def weights(self, source: tuple, target: tuple) -> tuple:
+        """Returns the (cached) interpolation weights from the source grid onto the target grid.
+        Output: one (lower index, upper index, upper weight, inside source sweep) tuple of arrays per axis"""
+        key = (source, target)
+        cached = self.__weights.get(key)
+        if cached:
+            return cached
+        cached = tuple(self.__axis_weights(s, v) for s, v in zip(source, grid_values(target)))
+        self.__weights[key] = cached
+        while len(self.__weights) > self.max_pairs: # drop the oldest
+            del self.__weights[next(iter(self.__weights))]
+        return cached
+
+    def __axis_weights(self, source: tuple, values: np.ndarray) -> tuple:
+        start, step, count = source
+        if count < 2 or step == 0:
+            inside = np.isclose(values, start)
+            zeros = np.zeros(len(values), dtype = np.intp)
+            return zeros, zeros, np.zeros(len(values)), inside
+        pos = (values - start)/step # fractional index of each value into the source sweep
+        eps = 1e-9*count # floating point slack at the sweep ends
+        inside = (pos >= -eps) & (pos <= count - 1 + eps)
+        pos = np.clip(pos, 0, count - 1)
+        lower = np.minimum(np.floor(pos).astype(np.intp), count - 2)
+        return lower, lower + 1, pos - lower, inside
+
+    def regrid_array(self, array: np.ndarray, source: tuple, target: tuple) -> np.ndarray:
+        """Interpolates array, or a stack of arrays in its last two dimensions, from the source grid onto
+        the target grid. Points outside the source sweep become NaN."""
+        if source == target:
+            return array
+        (c0, c1, cw, c_in), (r0, r1, rw, r_in) = self.weights(source, target)
+        array = np.asarray(array, dtype = np.float64)
+        cols = array[..., c0]*(1 - cw) + array[..., c1]*cw
+        out = cols[..., r0, :]*(1 - rw)[:, None] + cols[..., r1, :]*rw[:, None]
+        out[..., ~(r_in[:, None] & c_in[None, :])] = np.nan
+        return out
+
+    def regrid(self, Set: File, onto, index = -1) -> np.ndarray:
+        """Interpolates the data at header index `index` of Set onto another grid
+        Input:  onto -> a DataSet to take the grid of, or a grid in the form of sweep_grid()
+        Output: (rows, cols) array on the new grid"""
+        target = onto if type(onto) == tuple else sweep_grid(onto)
+        return self.regrid_array(Set.get_data(index), sweep_grid(Set), target)
+
+
 # ==============================================================================
 #               DataBank
 # ==============================================================================
 class DataBank:
+    lod: LevelOfDetail = File.lod # File.lod.full_resolution = True switches every 3D plot to full resolution
+    ratio_cache_size: int = 4 # number of divide() results (and of drop_zeros() masks) each DataBank keeps
+    regridder: Regridder = Regridder() # shared, so interpolation weights are reused across DataBanks
+    regrid_mismatched: bool = False # when True, the division plots interpolate DataSets swept on another grid instead of skipping them
+    __stacked_banks: WeakSet = WeakSet() # every DataBank that has called stack(), so shared DataSets can be spotted
     def __init__(self, Set: DataSet = None):
         self.DataSets = []
         self.X: list = []
@@ -739,6 +2046,13 @@ class DataBank:
         self.show_legend: bool = True
         self.Bank_Info: DataInfo = None
         self.override: bool = False
+        self.stacked: dict[int, np.ndarray] = None # header index -> (n_sets, rows, cols) array, see stack()
+        self.__stack_views: list[list] = [] # the views each DataSet was given into self.stacked
+        self.__zero_masks: dict = {} # (id(DivSet), divIdx, tolerance) -> (DivSet, divisor array, its m_version, mask), see drop_zeros()
+        self.__ratios: dict = {} # cached divide() results
+        self.version: int = 0 # incremented whenever DataSets are added or removed
+        self.__index: dict[str, np.ndarray] = None # columnar DataSet.Info metadata, see metadata()
+        self.__index_version: int = -1 # self.version the index was built at
         if Set:
             self.append(Set)
 
@@ -766,6 +2080,7 @@ class DataBank:
         """Method for appending DataSets to the DataBank"""
         assert(type(Set) == DataSet)
 
+        self.version += 1
         s_count = len(self.DataSets)
         if s_count == 0:
             self.DataSets.append(Set)
@@ -891,38 +2206,30 @@ class DataBank:
 
         ax1.set_title(self.Bank_Info.data_name)
         
+        X, Y, Z = [], [], []
         for i, S in enumerate(self.DataSets):
             x, y = S.get_data(0), S.get_data(1)
             z = S.get_data(Zindex)
-            dim1, dim2 = S.m_dim1_count, S.m_dim2_count
 
             cols = S.get_slicing('x', self.domain['x'])
             rows = S.get_slicing('y', self.domain['y'])
 
-
+            X.append(x[ rows[0]:rows[1], cols[0]:cols[1] ])
+            Y.append(y[ rows[0]:rows[1], cols[0]:cols[1] ])
+            Z.append(z[ rows[0]:rows[1], cols[0]:cols[1] ])
 
             color = S.color
             name = S.Info.data_name
             marker = S.marker
-            if self.connectors:
-                col_counts = dim1
-            else:
-                col_counts = 0
             if self.scatter_plots:
-                ax1.scatter3D(x[ rows[0]:rows[1], cols[0]:cols[1] ],
-                                y[ rows[0]:rows[1], cols[0]:cols[1] ],
-                                z[ rows[0]:rows[1], cols[0]:cols[1] ], 
+                ax1.scatter3D(X[i], Y[i], Z[i],
                                 marker = marker,
                                 color = color,
                                 label = name)
             else:
-                ax1.plot_wireframe( x[ rows[0]:rows[1], cols[0]:cols[1] ],
-                                y[ rows[0]:rows[1], cols[0]:cols[1] ],
-                                z[ rows[0]:rows[1], cols[0]:cols[1] ], 
-                                rcount=dim2, 
-                                ccount= col_counts,
-                                color = color,
-                                label = name)
+                ax1.plot([], [], [], color = color, label = name) # plot no data, just do this to get legend
+        if not self.scatter_plots: # every wireframe as one collection
+            self.draw_wireframes(ax1, X, Y, Z, [S.color for S in self.DataSets], self.connectors)
         if self.show_legend:
             plt.legend(loc='upper left')
         if self.show_fig:
@@ -960,55 +2267,44 @@ class DataBank:
 
         ax1.set_title(self.Bank_Info.data_name)
         X, Y, Z = [], [], []
-        colors, names, markers, dim1s, dim2s = [], [], [], [], []
+        colors, names, markers = [], [], []
+        ratios = self.divide(DivSet, divIdx, Zindex, drop_zeros, tolerance)
         for i, S in enumerate(self.DataSets):
             S_data_dims = (S.m_dim1_count, S.m_dim2_count)
 
-            # if dimensions mismatch, omit the data set
-            if S_data_dims != div_data_dims:
+            # if dimensions mismatch (and they weren't regridded), omit the data set
+            if i not in ratios['sets']:
                 print(f"\nDataSet at index ({i}) does not have matching x,y array dimensions of the dividing DataSet")
                 print(f"\t{S_data_dims} =/= {div_data_dims}")
                 print(f"Skipping DataSet ({i}) in DataBank\n")
                 # add a "skipped DataSets" list here to keep track of for labelling later down the line
                 continue
 
-            zdiv = DivSet.get_data(divIdx)
-            x = S.get_data(0)
-            y = S.get_data(1)
-            z = S.get_data(Zindex)
-            if drop_zeros:
-                zdiv, x, y, z = self.drop_zeros([zdiv, x, y, z], tolerance)
-
-            dim1s.append(S.m_dim1_count)
-            dim2s.append(S.m_dim2_count)
+            n = ratios['sets'].index(i)
+            x = ratios['axes'][0][n]
+            y = ratios['axes'][1][n]
+            z = ratios['ratio'][n]
 
             cols = self.get_slicing('x', self.domain['x'], x)
             rows = self.get_slicing('y', self.domain['y'], y)
 
             X.append(x[ rows[0]:rows[1], cols[0]:cols[1] ])
             Y.append(y[ rows[0]:rows[1], cols[0]:cols[1] ])
-            Z.append(z[ rows[0]:rows[1], cols[0]:cols[1] ] / zdiv[ rows[0]:rows[1], cols[0]:cols[1] ])
+            Z.append(z[ rows[0]:rows[1], cols[0]:cols[1] ])
 
             colors.append( S.color )
             names.append( S.Info.data_name )
             markers.append( S.marker )
         for i in range(len(X)):
-            if self.connectors:
-                col_counts = dim1s[i]
-            else:
-                col_counts = 0
-
             if self.scatter_plots:
                 ax1.scatter3D( X[i], Y[i], Z[i],
                                 marker = markers[i],
                                 color = colors[i],
                                 label = names[i])
             else:
-                ax1.plot_wireframe(X[i], Y[i], Z[i], 
-                                rcount=dim2s[i], 
-                                ccount=col_counts,
-                                color = colors[i],
-                                label = names[i])#cstride=file.m_dim2_count)
+                ax1.plot([], [], [], color = colors[i], label = names[i]) # plot no data, just do this to get legend
+        if not self.scatter_plots: # every wireframe as one collection
+            self.draw_wireframes(ax1, X, Y, Z, colors, self.connectors)
         if self.show_legend:
             plt.legend(loc='upper left')
         if self.show_fig:
@@ -1053,17 +2349,258 @@ class DataBank:
             print(f"Axis '{axis}' is not a valid axis choice. Select from either 'x'/0 or 'y'/1.")
         if show:
             print(f"Domain now:\n{self.domain}")
+        for S in self.DataSets: # the slicing of the old domain won't be needed again
+            S.reset_slicing()
 
     def reset_domain(self):
         self.domain = {'x': (-float('inf'), float('inf')), 'y': (-float('inf'), float('inf')), 'z': (-float('inf'), float('inf'))}
+        for S in self.DataSets:
+            S.reset_slicing()
         
     
     def pop(self, i:int =-1) -> DataSet:
         """Akin to str pop method. If len(DataSets) becomes 0, Bank_Info resets to None type"""
         S = self.DataSets.pop(i)
+        self.version += 1
         if len(self.DataSets) == 0:
             self.Bank_Info: DataInfo = None
         return S
+
+    def save_archive(self, path: str, append: bool = False, compress: int = 1):
+        """Saves every DataSet (data, headers, intervals, Info and style) into a single CampaignArchive file.
+        Input:  append -> add the DataSets to an existing archive instead of replacing it
+                compress -> zlib level of the data chunks, 0 to store them uncompressed (and memory-mappable)"""
+        if not append and Path(path).exists():
+            Path(path).unlink()
+        CampaignArchive(path).write(self.DataSets, compress)
+
+    def load_archive(self, path: str, indices: list[int] = None):
+        """Appends the DataSets of a CampaignArchive file (all of them by default) to the DataBank.
+        Only the archive's index is read now; each DataSet's data is read the first time it's needed."""
+        for S in CampaignArchive(path).DataSets(indices):
+            self.append(S)
+
+    def stack(self) -> bool:
+        """Copies the data of every DataSet into one contiguous (n_sets, rows, cols) array per header index,
+        stored in self.stacked, and replaces each DataSet's arrays with views into those arrays.
+        Bank-wide math can then be done with a single vectorized call, e.g. self.stacked[-1].mean(axis=0).
+        Compactly stored variables (see File.compact_grids) are left as they are. When every DataSet has the same
+        axis for one, its stacked array is a read-only broadcast view too.
+        A DataSet can only be stacked in one DataBank at a time: stacking DataSets that another DataBank has stacked
+        (e.g. the DataBank a select() came from) would unstack that DataBank, so it's refused unless override is set.
+        Output: False, leaving the DataSets as they were, if they don't all share the same grid and header count"""
+        if len(self.DataSets) == 0:
+            return False
+        if not self.override:
+            ids = {id(S) for S in self.DataSets}
+            for other in list(DataBank.__stacked_banks):
+                if other is not self and other.is_stacked() and any(id(S) in ids for S in other.DataSets):
+                    print("Error in .stack(): some DataSets are stacked in another DataBank, which stacking them here would unstack. "
+                          "Set override = True to stack them anyway")
+                    return False
+        for S in self.DataSets:
+            S.load()
+        shape, count = self.DataSets[0].m_shape, len(self.DataSets[0].m_headers)
+        for i, S in enumerate(self.DataSets):
+            if S.m_shape != shape or len(S.m_headers) != count:
+                print(f"DataSet ({i}) with shape {S.m_shape} and {len(S.m_headers)} headers can't be stacked with "
+                      f"DataSet (0) with shape {shape} and {count} headers")
+                return False
+
+        self.stacked = {}
+        for i in range(count):
+            axes = [S.m_axes.get(S.m_headers[i]) for S in self.DataSets]
+            if axes[0] and all(axis and axis[0] == axes[0][0] and np.array_equal(axis[1], axes[0][1]) for axis in axes):
+                self.stacked[i] = np.broadcast_to(self.DataSets[0].get_data(i), (len(self.DataSets),) + shape)
+            else:
+                self.stacked[i] = np.stack([S.get_data(i) for S in self.DataSets])
+        self.__stack_views = []
+        for s, S in enumerate(self.DataSets):
+            views = []
+            for i, header in enumerate(S.m_headers):
+                if header not in S.m_axes: # compact variables keep their own broadcast views
+                    S.m_datadict[header] = self.stacked[i][s]
+                views.append(S.m_datadict[header])
+            self.__stack_views.append(views)
+        DataBank.__stacked_banks.add(self)
+        return True
+
+    def is_stacked(self) -> bool:
+        """Whether self.stacked still holds the data of every DataSet, in order. Appending, popping, releasing
+        or reloading a DataSet, or replacing one of its arrays, unstacks the DataBank."""
+        if self.stacked is None or len(self.__stack_views) != len(self.DataSets):
+            return False
+        for S, views in zip(self.DataSets, self.__stack_views):
+            if len(S.m_headers) != len(views):
+                return False
+            for header, view in zip(S.m_headers, views):
+                if S.m_datadict.get(header) is not view:
+                    return False
+        return True
+
+    def get_stacked(self, index: int) -> np.ndarray:
+        """Returns the (n_sets, rows, cols) array of the data at header index `index` of every DataSet,
+        stacking the DataSets first if needed. Returns None if they can't be stacked."""
+        if not self.is_stacked() and not self.stack():
+            return None
+        return self.stacked[index % len(self.stacked)]
+
+    # metadata columns -> how to read them from a DataSet
+    metadata_columns = {'gate': lambda S: S.Info.gate,
+                        'test_type': lambda S: S.Info.test_type,
+                        'device_number': lambda S: S.Info.device_number,
+                        'device_model': lambda S: S.Info.device_model,
+                        'len': lambda S: S.Info.chan_dims['len'],
+                        'wid': lambda S: S.Info.chan_dims['wid'],
+                        'area': lambda S: S.Info.chan_dims['area'],
+                        'misc': lambda S: S.Info.misc or '',
+                        'file_code': lambda S: S.file_code}
+    numeric_columns = ('device_number', 'len', 'wid', 'area') # unknown values become NaN
+
+    def metadata(self) -> dict[str, np.ndarray]:
+        """Returns the columnar metadata index of the DataBank: one array per column of metadata_columns,
+        holding that field of every DataSet's Info in order. Rebuilt whenever DataSets are added or removed;
+        call reindex() after editing a DataSet's Info by hand."""
+        if self.__index is None or self.__index_version != self.version:
+            self.reindex()
+        return self.__index
+
+    def reindex(self):
+        """Rebuilds the metadata index from the DataSets' Info"""
+        index = {}
+        for column, read in DataBank.metadata_columns.items():
+            values = [read(S) for S in self.DataSets]
+            if column in DataBank.numeric_columns:
+                index[column] = np.array([v if type(v) in (int, float) else np.nan for v in values], dtype = np.float64)
+            else:
+                index[column] = np.array([str(v) for v in values], dtype = str)
+        self.__index, self.__index_version = index, self.version
+
+    def query(self, **conditions) -> 'DataBank':
+        """Returns a sub-bank of the DataSets whose metadata match every condition.
+        Conditions are column=value for equality, or column__op=value with op one of
+        eq, ne, lt, le, gt, ge, in (value is a list) or contains (substring of a text column).
+        e.g. B.query(area__ge=10000, gate='top', misc__contains='post-epoxy')"""
+        index = self.metadata()
+        keep = np.ones(len(self.DataSets), dtype = bool)
+        for condition, value in conditions.items():
+            column, _, op = condition.partition('__')
+            if column not in index:
+                raise Exception(f"Error: invalid metadata column '{column}'. Pick from {list(index)}")
+            values = index[column]
+            match op or 'eq':
+                case 'eq': keep &= values == value
+                case 'ne': keep &= values != value
+                case 'lt': keep &= values < value
+                case 'le': keep &= values <= value
+                case 'gt': keep &= values > value
+                case 'ge': keep &= values >= value
+                case 'in': keep &= np.isin(values, list(value))
+                case 'contains': keep &= np.char.find(values.astype(str), str(value)) >= 0
+                case _: raise Exception(f"Error: invalid query operator '{op}'. Pick from eq, ne, lt, le, gt, ge, in, contains")
+        return self.select(np.flatnonzero(keep))
+
+    def sort_by(self, column: str, reverse: bool = False) -> 'DataBank':
+        """Returns a sub-bank of all the DataSets, ordered by a metadata column (NaN last).
+        The sort is stable both ways: DataSets with equal values keep their order"""
+        index = self.metadata()
+        if column not in index:
+            raise Exception(f"Error: invalid metadata column '{column}'. Pick from {list(index)}")
+        key = index[column]
+        if reverse: # sort on a descending key, as reversing the ascending order would also reverse ties
+            key = -key if column in DataBank.numeric_columns else -np.unique(key, return_inverse = True)[1]
+        return self.select(np.argsort(key, kind = 'stable')) # NaN (and -NaN) sort last
+
+    def select(self, indices) -> 'DataBank':
+        """Returns a sub-bank holding the DataSets at indices (a list of ints or a boolean mask), in that order.
+        The sub-bank shares the DataSets, and so their data arrays, with this one; nothing is copied."""
+        indices = np.arange(len(self.DataSets))[np.asarray(indices)] if len(indices) else np.array([], dtype = int)
+        sub = self.__empty_like(indices)
+        sub.DataSets = [self.DataSets[i] for i in indices]
+        if sub.DataSets:
+            sub.Bank_Info = self.Bank_Info.make_copy()
+            if hasattr(self, 'title'):
+                sub.title, sub.units = self.title, self.units
+        sub.version += 1
+        sub.__index = {column: values[indices] for column, values in self.metadata().items()}
+        sub.__index_version = sub.version
+        return sub
+
+    def __empty_like(self, indices = None) -> 'DataBank':
+        '''An empty DataBank (or Plotter) with the same plot settings as this one, see copy_settings()'''
+        sub = type(self)()
+        sub.copy_settings(self, indices)
+        return sub
+
+    def copy_settings(self, other: 'DataBank', indices = None):
+        '''Copies the plot settings of other onto this bank.
+            indices: the DataSets of other this bank holds, in order; picks their entries from per-DataSet settings'''
+        for attr in ('scatter_plots', 'show_fig', 'auto_labels', 'connectors', 'show_legend', 'override'):
+            setattr(self, attr, getattr(other, attr))
+        self.domain = dict(other.domain)
+
+    def groupby(self, key, stats: tuple = ('mean', 'std', 'min', 'max'), Zindex = -1) -> 'DataBank':
+        """Groups the DataSets and reduces each group's Zindex data point by point, e.g. the mean Id surface
+        of every device model.
+
+        Input:  key -> a metadata column (see metadata()), e.g. 'device_model' or 'area',
+                       or a function taking a DataSet and returning its group
+                stats -> reductions to compute: 'mean', 'std', 'min', 'max', 'median', or 'p<q>' for the q-th percentile (e.g. 'p90')
+                Zindex -> header index of the data to reduce
+
+        Output: a DataBank (or Plotter) holding one aggregate DataSet per group, in order of first appearance.
+                Each has the x and y data of the group's first DataSet followed by one header per stat
+                (e.g. 'Id mean' at index 2, 'Id std' at index 3), so it can be drawn with quick_plot3d(2) etc.
+                DataSets swept on another grid than the group's first are interpolated onto it (see regrid())"""
+        for stat in stats:
+            if stat not in ('mean', 'std', 'min', 'max', 'median') and not (stat[0] == 'p' and stat[1:].replace('.', '', 1).isdigit()):
+                raise Exception(f"Error: invalid stat '{stat}'. Pick from 'mean', 'std', 'min', 'max', 'median', or 'p<q>'")
+        if callable(key):
+            labels = [key(S) for S in self.DataSets]
+        else:
+            values = self.metadata().get(key)
+            if values is None:
+                raise Exception(f"Error: invalid metadata column '{key}'. Pick from {list(self.metadata())}")
+            labels = [v if v == v else None for v in values.tolist()] # NaN != NaN, so unknowns get grouped as None
+        groups: dict = {} # label -> indices of its DataSets
+        for i, label in enumerate(labels):
+            groups.setdefault(label, []).append(i)
+
+        out = self.__empty_like([indices[0] for indices in groups.values()]) # styled like each group's first DataSet
+        out.override = True # groups may differ in gate/test type
+        for label, indices in groups.items():
+            template = self.DataSets[indices[0]]
+            grid = sweep_grid(template)
+            stack = np.stack([S.get_data(Zindex) if sweep_grid(S) == grid else DataBank.regridder.regrid(S, grid, Zindex)
+                              for S in (self.DataSets[i] for i in indices)])
+            nan = np.isnan(stack).any() # only regridding outside a sweep makes NaN, so skip the slower nan-reductions otherwise
+            percentiles = [float(stat[1:]) for stat in stats if stat[0] == 'p']
+            if percentiles:
+                percentiles = dict(zip(percentiles, (np.nanpercentile if nan else np.percentile)(stack, percentiles, axis = 0)))
+
+            agg = copy(template) # shares the x and y data, nothing else
+            agg.detach() # there's no csv behind it to reload from
+            agg.Info = template.Info.make_copy()
+            agg.Info.data_name = (f"{label}" if callable(key) else f"{key} = {label:g}" if type(label) == float else f"{key} = {label}") + f" (n={len(indices)})"
+            agg.Info.misc = 'aggregate of ' + ', '.join(self.DataSets[i].Info.data_name for i in indices)
+            agg.m_headers = [template.m_headers[0], template.m_headers[1]]
+            agg.m_datadict = {h: template.get_data(k) for k, h in enumerate(agg.m_headers)}
+            agg.m_axes, agg.m_slicing = {}, {}
+            name = template.get_data_name(Zindex)
+            for stat in stats:
+                match stat:
+                    case 'mean': z = (np.nanmean if nan else np.mean)(stack, axis = 0)
+                    case 'std': z = (np.nanstd if nan else np.std)(stack, axis = 0)
+                    case 'min': z = (np.nanmin if nan else np.min)(stack, axis = 0)
+                    case 'max': z = (np.nanmax if nan else np.max)(stack, axis = 0)
+                    case 'median': z = (np.nanmedian if nan else np.median)(stack, axis = 0)
+                    case _: z = percentiles[float(stat[1:])]
+                agg.add_new_data(f"{name} {stat}", z)
+            out.append(agg)
+        out.override = self.override
+        if hasattr(self, 'title'):
+            out.units = dict(self.units) # append() took the first aggregate's
+        return out
     
     def create_projection_mapping(self, X2: list):
         """creates a dictionary of valid column indices as keys and
@@ -1085,6 +2622,117 @@ class DataBank:
 
         return meta_col_data, meta_color_data
 
+    def curve_colors(self, s: int, X2: list, colors: list, cmap, meta_color_data: dict, norm) -> np.ndarray:
+        """Returns the colors of all the curves of DataSet s at once, as a (len(X2[s]), 3 or 4) array.
+        With no cmap (cmap is meta_color_data), the DataSet's color is shaded by its meta_color_data,
+        otherwise the colormap named cmap is sampled at norm(X2[s])."""
+        if type(cmap) == dict:
+            shades = np.broadcast_to(meta_color_data[s], len(X2[s])) # a single shade when x2 doesn't vary
+            return np.outer(shades, colors[s])
+        my_cmap = plt.get_cmap(cmap)
+        return my_cmap(np.asarray(256*norm(X2[s])).astype(int))
+
+    def draw_sets2d(self, ax, X: list, Y: list, rc_reversal: bool, meta_col_data: dict, set_colors: list, markers: list,
+                    line_styles: list, scatter: bool):
+        """Draws curve col of every DataSet s, (X[s], Y[s][col, :]) or (X[s], Y[s][:, col]) when rc_reversal, column by
+        column and DataSet by DataSet within a column, so overlapping curves of different DataSets stack in the same
+        order as when each curve was its own ax.plot() call.
+        set_colors: the colors of the curves of each DataSet, see curve_colors()
+        markers, line_styles: one per DataSet"""
+        rgba = [mpl.colors.to_rgba_array(c) for c in set_colors]
+        xs, ys, colors, curve_markers, curve_styles = [], [], [], [], []
+        for col, sets in meta_col_data.items():
+            for s in sets:
+                xs.append(X[s])
+                ys.append(Y[s][:, col] if rc_reversal else Y[s][col, :])
+                colors.append(rgba[s][col])
+                curve_markers.append(markers[s])
+                curve_styles.append(line_styles[s])
+        self.draw_curves(ax, xs, ys, np.array(colors), curve_markers, curve_styles, scatter = scatter or rc_reversal)
+
+    def draw_curves(self, ax, xs: list, ys: list, colors: np.ndarray, markers: list, linestyles: list, scatter: bool = False):
+        """Draws the curves (xs[i], ys[i]) with one LineCollection plus one PathCollection for their markers, or with
+        one PathCollection if scatter is True, instead of one artist per curve. Curves stack in the order given, like
+        the ax.plot()/ax.scatter() calls they replace, except that the markers sit above all of the lines.
+        colors, markers, linestyles: one per curve"""
+        if not scatter:
+            lines = mpl.collections.LineCollection([np.column_stack((x, y)) for x, y in zip(xs, ys)],
+                                                   colors = colors, linestyles = linestyles)
+            ax.add_collection(lines)
+            ax.autoscale_view()
+        self.draw_markers(ax, xs, ys, colors, markers, like_plot = not scatter)
+
+    def draw_markers(self, ax, xs: list, ys: list, colors: np.ndarray, markers: list, like_plot: bool = True):
+        """Draws the markers of the curves (xs[i], ys[i]) as one PathCollection, in order, like one ax.scatter() per curve.
+        colors, markers: one per curve
+        like_plot: size the markers like ax.plot() draws them rather than like ax.scatter()"""
+        styles = {} # marker -> (path, size, line width)
+        for m in dict.fromkeys(markers):
+            if m in ('', ' ', None, 'None', 'none'):
+                continue
+            style = mpl.markers.MarkerStyle(m)
+            if like_plot:
+                options = self.plot_marker_style(m)
+            else: # ax.scatter()'s defaults
+                options = {'s': mpl.rcParams['lines.markersize']**2,
+                           'linewidths': mpl.rcParams['patch.linewidth'] if style.is_filled() else mpl.rcParams['lines.linewidth']}
+            styles[m] = (style.get_path().transformed(style.get_transform()), options['s'], options['linewidths'])
+        drawn = [i for i, m in enumerate(markers) if m in styles]
+        if not drawn:
+            return
+        kinds = list(styles)
+        lengths = [len(xs[i]) for i in drawn]
+        x = np.concatenate([np.ravel(xs[i]) for i in drawn])
+        y = np.concatenate([np.ravel(ys[i]) for i in drawn])
+        point_colors = np.repeat(mpl.colors.to_rgba_array(colors[drawn]), lengths, axis = 0)
+        kind = np.repeat([kinds.index(markers[i]) for i in drawn], lengths)
+        finite = np.isfinite(x) & np.isfinite(y) # like ax.scatter(), leave out NaN points
+        x, y, point_colors, kind = x[finite], y[finite], point_colors[finite], kind[finite]
+        paths = [styles[k][0] for k in kinds]
+        sizes = np.array([styles[k][1] for k in kinds])
+        widths = np.array([styles[k][2] for k in kinds])
+        if len(kinds) > 1: # one path per point, the collection cycles through paths, sizes and widths with the points
+            paths, sizes, widths = [paths[k] for k in kind], sizes[kind], widths[kind]
+        points = mpl.collections.PathCollection(paths, sizes, facecolors = point_colors, edgecolors = point_colors,
+                                                linewidths = widths, offsets = np.column_stack((x, y)),
+                                                offset_transform = ax.transData)
+        points.set_transform(mpl.transforms.IdentityTransform())
+        ax.add_collection(points)
+        ax.autoscale_view()
+
+    def plot_marker_style(self, marker: str) -> dict:
+        """Returns the ax.scatter() options that draw marker the size ax.plot() draws it. The outline of round
+        markers is folded into their size rather than stroked, which renders several times faster."""
+        size, edge = mpl.rcParams['lines.markersize'], mpl.rcParams['lines.markeredgewidth']
+        if marker not in ('.', 'o'): # the outline of pointed markers doesn't grow them evenly
+            return {'s': size**2, 'linewidths': edge}
+        style = mpl.markers.MarkerStyle(marker)
+        width = style.get_path().transformed(style.get_transform()).get_extents().width # of the marker at size 1
+        return {'s': (size + edge/width)**2, 'linewidths': 0}
+
+    def draw_wireframes(self, ax, X: list, Y: list, Z: list, colors: list, connectors: bool):
+        """Draws the wireframes of several DataSets (what ax.plot_wireframe() draws for each of them) as a single
+        Line3DCollection, so drawing and rotating the plot doesn't slow down with the number of DataSets.
+        Dense wireframes are decimated to DataBank.lod's budget, keeping the min and max of each block.
+        colors: one color per DataSet
+        connectors: also draw the lines along the columns (y), not only along the rows (x)"""
+        segments, segment_colors = [], []
+        for lines, color in zip(DataBank.lod.wireframe(X, Y, Z, connectors), colors):
+            segments += lines
+            segment_colors += [color]*len(lines)
+        ax.add_collection3d(art3d.Line3DCollection(segments, colors = segment_colors))
+        ax.auto_scale_xyz(np.concatenate([np.ravel(x) for x in X]), np.concatenate([np.ravel(y) for y in Y]),
+                          np.concatenate([np.ravel(z) for z in Z]), had_data = False)
+
+
+    def decimate_curves(self, S: DataSet, y_idx, x: np.ndarray, y: np.ndarray, rows: tuple, cols: tuple, width: int = None) -> tuple:
+        """Decimates the curves (x, y[i, :]) of DataSet S, sliced to rows/cols of the domain, to the min and max of each
+        pixel column of a plot `width` pixels wide (a default figure's width if None). See LevelOfDetail.curves().
+        Cached by (DataSet, domain, width) until the DataSet is filled in place, so replotting the same DataSets is instant."""
+        if width is None:
+            width = DataBank.lod.default_width()
+        key = (id(S), y_idx, tuple(rows), tuple(cols), width)
+        return DataBank.lod.curves(x, y, width, key, S.get_data(y_idx), S.m_version)
 
     def quick_plot2d(self, x_idx, y_idx, cbar: bool = True, cmap:str = None, **kwargs):
         """Given the selected independent x-axis and dependent y-axis, generate a 2D plot projected
@@ -1144,6 +2792,8 @@ class DataBank:
                 x = x[ 0, cols[0]:cols[1] ]
                 y = y[ rows[0]:rows[1], cols[0]:cols[1] ]
                 rc_reversal = False # the order of rows and columns is preserved
+                if not self.scatter_plots: # a line needs no more than 2 points per pixel column
+                    x, y = self.decimate_curves(S, y_idx, x, y, rows, cols, int(ax1.bbox.width))
             else:
                 # x varies by columns and y varies by rows, so if x_idx == 'y' and x2_idx == 'x'
                 #   then the row and column slicing must be swapped accordingly.
@@ -1168,6 +2818,7 @@ class DataBank:
             line_styles.append(S.ln_style)
 
         meta_col_data, meta_color_data = self.create_projection_mapping(X2)
+        norm = plt.Normalize(X2[0].min(), X2[0].max()) # curve colors of cmap, when there's no color bar
 
         # discrete=True
         if cmap:
@@ -1220,27 +2871,8 @@ class DataBank:
                         ticks = ticks + step/2 # the location of where to put the tick marks on the colorbar  
                         )
 
-        for col, sets in meta_col_data.items():
-            for s in sets:
-                if type(cmap) == dict:
-                    color = meta_color_data[s][col] * colors[s]
-                else: # type(meta_col_data) == mpl.colors.LinearSegmentedColormap:
-                    my_cmap = plt.get_cmap(cmap)
-                    color = my_cmap( int(256*norm(X2[s][col])) )
-                if not rc_reversal:
-                    if self.scatter_plots:
-                        ax1.scatter(X[s], Y[s][col, :], 
-                                color = color, 
-                                marker = markers[s])
-                    else:
-                        ax1.plot(X[s], Y[s][col, :], 
-                             color = color,
-                             marker = markers[s])
-                else:
-                    ax1.scatter(X[s], Y[s][:, col], 
-                                color = color, 
-                                marker = markers[s])
-                                #marker='.')
+        set_colors = [self.curve_colors(s, X2, colors, cmap, meta_color_data, norm) for s in range(len(X))]
+        self.draw_sets2d(ax1, X, Y, rc_reversal, meta_col_data, set_colors, markers, ['-']*len(X), self.scatter_plots)
         if self.show_legend:
             for s in range(len(names)):
                 if self.scatter_plots:
@@ -1305,25 +2937,24 @@ class DataBank:
         div_data_dims = (DivSet.m_dim1_count, DivSet.m_dim2_count)
 
         X, X2, Y = [], [], []
+        x_axis, x2_axis = self.process_axis(x_idx, num_output=True), self.process_axis(x2_idx, num_output=True)
+        ratios = self.divide(DivSet, divIdx, y_idx, drop_zeros, tolerance, (x_axis, x2_axis))
 
         for i, S in enumerate(self.DataSets):
             S_data_dims = (S.m_dim1_count, S.m_dim2_count)
 
-            # if dimensinos mismatch, omit the data set
-            if S_data_dims != div_data_dims:
+            # if dimensinos mismatch (and they weren't regridded), omit the data set
+            if i not in ratios['sets']:
                 print(f"\nDataSet at index ({i}) does not have matching x,y array dimensions of the dividing DataSet")
                 print(f"\t{S_data_dims} =/= {div_data_dims}")
                 print(f"Skipping DataSet ({i}) in DataBank\n")
                 # add a "skipped DataSets" list here to keep track of for labelling later down the line
                 continue
 
-            ydiv: list = DivSet.get_data(divIdx)
-            x: list = S.get_data(self.process_axis(x_idx, num_output=True))
-            x2: list= S.get_data(self.process_axis(x2_idx, num_output=True))
-            y: list = S.get_data(y_idx)/ydiv
-
-            if drop_zeros:
-                ydiv, x, x2, y = self.drop_zeros([ydiv, x, x2, y], tolerance)
+            n = ratios['sets'].index(i)
+            x: list = ratios['axes'][x_axis][n]
+            x2: list= ratios['axes'][x2_axis][n]
+            y: list = ratios['ratio'][n]
 
             ######################## Domain Restriction implementation ##############################
 
@@ -1360,6 +2991,7 @@ class DataBank:
             line_styles.append(S.ln_style)
         
         meta_col_data, meta_color_data = self.create_projection_mapping(X2)       
+        norm = plt.Normalize(X2[0].min(), X2[0].max()) # curve colors of cmap, when there's no color bar
         if cmap:
             cmap = cmap
         else:
@@ -1434,27 +3066,8 @@ class DataBank:
 
 
         ##################### plot_data ###############################
-        for col, sets in meta_col_data.items():
-            for s in sets:
-                if type(cmap) == dict:
-                    color = meta_color_data[s][col] * colors[s]
-                else: # type(meta_col_data) == mpl.colors.LinearSegmentedColormap:
-                    my_cmap = plt.get_cmap(cmap)
-                    color = my_cmap( int(256*self.norm(X2[s][col])) )
-                if not rc_reversal:
-                    if self.scatter_plots:
-                        plt.scatter(X[s], Y[s][col, :], 
-                                color = color, 
-                                marker = markers[s])
-                    else:
-                        plt.plot(X[s], Y[s][col, :], 
-                             color = color,
-                             #  color = meta_color_data[s][col] * self.colors[s],
-                             marker = markers[s])
-                else:
-                    plt.scatter(X[s], Y[s][:, col], 
-                                color = color, 
-                                marker = markers[s])
+        set_colors = [self.curve_colors(s, X2, colors, cmap, meta_color_data, norm) for s in range(len(X))]
+        self.draw_sets2d(ax1, X, Y, rc_reversal, meta_col_data, set_colors, markers, ['-']*len(X), self.scatter_plots)
         
         if self.show_legend:
             for s in range(len(names)):
@@ -1513,30 +3126,151 @@ class DataBank:
         ytrimmed = y[ rows[0]:rows[1], cols[0]:cols[1] ]
         """
 
-    def drop_zeros(self, arrays: list[np.array], tolerance: float = -1)->list[np.array]:
+    def drop_zeros(self, arrays: list[np.array], tolerance: float = -1, DivSet: DataSet = None, divIdx = None)->list[np.array]:
         """Input a list of np.arrays of the same dimensions. Finds the columns and rows that are all zero in arrays[0],
         Drops the rows/columns of the 0th element of the input array that are all zeros from all arrays in the input.
         
         Input: arrays: list[np.array] -> arrays to drop zeros from using 0th item to determine what to drop
+               DivSet, divIdx -> if arrays[0] is DivSet.get_data(divIdx), the rows/columns to drop are remembered,
+                    so dividing many DataSets by the same DivSet only finds them once
         
-        Output: list[np.array] with rows/colums of zeros dropped"""
-        drop_arr = arrays[0].copy()
-        if tolerance == -1:
-            min = np.min(np.absolute(drop_arr))
-            var = np.var(drop_arr)
-            tolerance = min+var
+        Output: list[np.array] with rows/colums of zeros dropped. These are views of the input arrays
+                when the rows/columns that are kept are contiguous (the usual case), and copies otherwise"""
+        mask = self.__get_zero_mask(arrays[0], tolerance, DivSet, divIdx)
+        return [self.__apply_mask(array, mask) for array in arrays]
+
+    def __get_zero_mask(self, divisor: np.array, tolerance: float, DivSet: DataSet = None, divIdx = None) -> tuple:
+        '''zero_mask() of divisor, cached if it's DivSet.get_data(divIdx)'''
+        if DivSet is None:
+            return self.zero_mask(divisor, tolerance)
+        key = (id(DivSet), divIdx, tolerance)
+        cached = self.__zero_masks.get(key)
+        if cached and cached[0] is DivSet and cached[1] is divisor and cached[2] == DivSet.m_version: # data wasn't replaced or filled in place
+            return cached[3]
+        mask = self.zero_mask(divisor, tolerance)
+        self.__zero_masks[key] = (DivSet, divisor, DivSet.m_version, mask)
+        while len(self.__zero_masks) > DataBank.ratio_cache_size: # drop the oldest, so old DivSets can be freed
+            del self.__zero_masks[next(iter(self.__zero_masks))]
+        return mask
+
+    def __apply_mask(self, array: np.array, mask: tuple) -> np.array:
+        '''Keeps the (rows, cols) of a zero_mask() in the last two dimensions of array'''
+        rows, cols = mask
+        if type(rows) == slice or type(cols) == slice:
+            return array[..., rows, :][..., cols]
+        rows, cols = np.ix_(rows, cols)
+        return array[..., rows, cols]
+
+    def divide(self, DivSet: DataSet, divIdx, Zindex = -1, drop_zeros: bool = True, tolerance: float = -1, axes: tuple = (0, 1),
+               regrid: bool = None) -> dict:
+        """Divides the Zindex data of every DataSet by DivSet's divIdx data, in one broadcast operation over the bank.
+        DataSets whose grid doesn't match DivSet's are left out, or interpolated onto DivSet's grid if regrid is True
+        (defaults to DataBank.regrid_mismatched). Points where the divisor is 0 come out as NaN.
+        Results are cached, so plotting against the same DivSet again doesn't recompute anything.
+
+        Input:  DivSet, divIdx -> the DataSet and header index to divide by
+                Zindex -> header index of the DataSets' data to divide
+                drop_zeros, tolerance -> drop the rows/columns where the divisor is all zero (see drop_zeros())
+                axes -> header indices of the other data to return alongside the ratios
+                regrid -> interpolate DataSets swept on another grid instead of leaving them out
+
+        Output: dict of 'sets' -> indices of the DataSets that were divided
+                        'ratio' -> (n_sets, rows, cols) float64 array of their ratios
+                        'axes' -> {header index: list of the matching arrays of those DataSets} for each of axes"""
+        if regrid is None:
+            regrid = DataBank.regrid_mismatched
+        divisor = DivSet.get_data(divIdx)
+        sources = [S.get_data(Zindex) for S in self.DataSets]
+        versions = [DivSet.m_version] + [S.m_version for S in self.DataSets] # change when data is filled in place, e.g. by a LiveReader
+        key = (self.version, id(DivSet), divIdx, Zindex, drop_zeros, tolerance, tuple(axes), regrid)
+        cached = self.__ratios.get(key)
+        if (cached and cached['DivSet'] is DivSet and cached['divisor'] is divisor # nothing was reloaded or replaced
+                and len(cached['sources']) == len(sources) and all(a is b for a, b in zip(cached['sources'], sources))
+                and cached['versions'] == versions):
+            return cached['result']
 
-        drop_arr = arrays[0].copy()
-        drop_arr[np.absolute(drop_arr) <= tolerance] = 0
+        div_data_dims = (DivSet.m_dim1_count, DivSet.m_dim2_count)
+        matching = [(S.m_dim1_count, S.m_dim2_count) == div_data_dims for S in self.DataSets]
+        sets = [i for i, match in enumerate(matching) if match or regrid]
+        def get(i, k): # data at header index k of DataSet i, on DivSet's grid
+            if matching[i]:
+                return self.DataSets[i].get_data(k)
+            if k % len(DivSet.get_headers()) in (0, 1): # the x/y of DivSet's grid, rather than interpolated (NaN outside the sweep)
+                return DivSet.get_data(k)
+            return DataBank.regridder.regrid(self.DataSets[i], DivSet, k)
+
+        if all(matching) and self.is_stacked():
+            z = self.stacked[Zindex % len(self.stacked)] # already one contiguous array
+        elif sets:
+            z = np.stack([get(i, Zindex) for i in sets])
+        else:
+            z = np.empty((0,) + divisor.shape)
+        ratio = np.full(z.shape, np.nan)
+        np.divide(z, divisor, out = ratio, where = divisor != 0, dtype = np.float64) # upcast: ratios of float32 data lose precision
+        others = {k: [get(i, k) for i in sets] for k in axes}
+        if drop_zeros:
+            mask = self.__get_zero_mask(divisor, tolerance, DivSet, divIdx)
+            ratio = self.__apply_mask(ratio, mask)
+            others = {k: [self.__apply_mask(a, mask) for a in arrays] for k, arrays in others.items()}
+
+        result = {'sets': sets, 'ratio': ratio, 'axes': others}
+        self.__ratios[key] = {'DivSet': DivSet, 'divisor': divisor, 'sources': sources, 'versions': versions, 'result': result}
+        while len(self.__ratios) > DataBank.ratio_cache_size: # drop the oldest
+            del self.__ratios[next(iter(self.__ratios))]
+        return result
+
+    def regrid(self, onto = 'intersection', Zindex = -1) -> dict:
+        """Interpolates the Zindex data of every DataSet onto one common grid, so DataSets swept with
+        different counts or steps can be compared point by point. DataSets sharing a sweep grid are
+        interpolated together in one operation.
+
+        Input:  onto -> 'intersection' or 'union' for a common_grid() of the DataBank, a DataSet to take the grid of,
+                        or a grid in the form of sweep_grid()
+                Zindex -> header index of the data to interpolate
+
+        Output: dict of 'grid' -> the grid, in the form of sweep_grid()
+                        'x', 'y' -> (rows, cols) meshgrids of the grid's values
+                        'z' -> (n_sets, rows, cols) array of the interpolated data, NaN outside each DataSet's sweep
+                Returns None if there's no common grid"""
+        if type(onto) == str:
+            target = common_grid(self.DataSets, onto)
+        elif type(onto) == tuple:
+            target = onto
+        else:
+            target = sweep_grid(onto)
+        if target is None or len(self.DataSets) == 0:
+            return None
 
-        zero_rows = [i for i in range(drop_arr.shape[0]) if not drop_arr[i,:].any()]
-        zero_cols = [i for i in range(drop_arr.shape[1]) if not drop_arr[:,i].any()]
+        x, y = np.meshgrid(*grid_values(target))
+        z = np.empty((len(self.DataSets),) + x.shape)
+        groups: dict[tuple, list[int]] = {} # source grid -> indices of the DataSets swept on it
+        for i, S in enumerate(self.DataSets):
+            groups.setdefault(sweep_grid(S), []).append(i)
+        for source, indices in groups.items():
+            if len(indices) == len(self.DataSets) and self.is_stacked():
+                stack = self.stacked[Zindex % len(self.stacked)]
+            else:
+                stack = np.stack([self.DataSets[i].get_data(Zindex) for i in indices])
+            z[indices] = DataBank.regridder.regrid_array(stack, source, target)
+        return {'grid': target, 'x': x, 'y': y, 'z': z}
 
-        for i in range(len(arrays)):     
-            arrays[i] = np.delete(arrays[i], zero_rows, axis=0)
-            arrays[i] = np.delete(arrays[i], zero_cols, axis=1)   
+    def zero_mask(self, divisor: np.array, tolerance: float = -1) -> tuple:
+        """Finds the rows and columns of divisor that are not all zero, to within tolerance.
+        tolerance = -1 uses the smallest absolute value of divisor plus its variance.
 
-        return arrays
+        Output: (rows, cols) to index arrays with to keep those rows and columns. Each is a slice if what's kept is
+                contiguous, so indexing gives a view, or an array of indices otherwise"""
+        if tolerance == -1:
+            tolerance = np.min(np.absolute(divisor)) + np.var(divisor)
+        nonzero = (divisor != 0) & ~(np.absolute(divisor) <= tolerance) # NaN counts as nonzero
+        kept = []
+        for keep in [nonzero.any(axis=1), nonzero.any(axis=0)]: # rows, then columns
+            idx = np.flatnonzero(keep)
+            if len(idx) == 0 or idx[-1] - idx[0] + 1 == len(idx):
+                kept.append(slice(idx[0], idx[-1]+1) if len(idx) else slice(0, 0))
+            else:
+                kept.append(idx)
+        return tuple(kept)
 
 
     def set_name(self, bank_name: str):
@@ -1667,6 +3401,8 @@ class Plotter(DataBank):
         self.limits = {'x': [-5.1,5.1], 'y': [-5.1,5.1], 'z': []}
         self.legend_loc = 'upper left'
         self.legend_title = ''
+        self.max_fps: float = 10 # refresh rate cap of live_plot2d()
+        self.__live_readers: list = [] # the LiveReaders followed by live_plot2d()
 
         if len(self.DataSets) > 0:
             self.units = self.Bank_Info.units
@@ -1678,9 +3414,24 @@ class Plotter(DataBank):
             labels = self.make_auto_labels(labels[0], labels[1], labels[2])
             self.title = self.Bank_Info.data_name
     
+    def copy_settings(self, other: 'Plotter', indices = None):
+        '''Copies the plot settings of other onto this Plotter, the DataBank ones included.
+            indices: the DataSets of other this Plotter holds, in order; picks their colors, markers, line styles and names'''
+        super().copy_settings(other, indices)
+        for attr in ('ticks', 'labels', 'units', 'scale', 'limits'):
+            setattr(self, attr, {axis: (list(value) if type(value) == list else value) for axis, value in getattr(other, attr).items()})
+        for attr in ('legend_loc', 'legend_title', 'my_cmap', 'cmap', 'norm', 'max_fps'):
+            setattr(self, attr, getattr(other, attr))
+        for attr in ('colors', 'markers', 'm_line_styles', 'names'):
+            values = getattr(other, attr)
+            if indices is not None and len(values) == len(other.DataSets):
+                values = [values[i] for i in indices] # one entry per DataSet, so follow the selection
+            setattr(self, attr, list(values))
+
     def append(self, Set: DataSet):
         '''Method for adding DataSets to Plotter'''
         assert(type(Set) == DataSet)
+        self.version += 1
         s_count = len(self.DataSets)
         if s_count == 0:
             self.DataSets.append(Set)
@@ -1715,7 +3466,7 @@ class Plotter(DataBank):
         print(f" Plotter.show_fig      = {self.show_fig}")
         print(f" Plotter.connectors    =  {self.connectors}")
 
-    def legend(self, ax: mpl.axes._axes.Axes):
+    def legend(self, ax: 'mpl.axes._axes.Axes'):
         '''Given an matplotlib axis "ax", will create a plot's legend for the Plotter object,
         populating the legend with the names and line styles of the Plotter's DataSets. 
         If the Plotter has a non-empty legend_title, the a legend title matching the Plotter's
@@ -1759,7 +3510,7 @@ class Plotter(DataBank):
     #     if type(line_styles) == str:
     #         self.markers = [line_styles]
 
-    def get_data2d(self, x_idx, y_idx, copy_style: bool):
+    def get_data2d(self, x_idx, y_idx, copy_style: bool, width: int = None):
         '''
         indices
             x_idx = 'x'/'y' or 0/1 and will select data for x-axis of 2D plot
@@ -1772,6 +3523,9 @@ class Plotter(DataBank):
             True  -> will overwrite colors and markers with the DataSets'
             False -> will leave colors and markers untouched and set to user set values
                     to change markers or labels use their respective .set_markers()/.set_names() functions. 
+        width: int
+            pixel width the curves are decimated for, keeping the min and max of each pixel column (see decimate_curves()).
+            Defaults to a default figure's width. Set File.lod.full_resolution = True to get every point.
         '''
         if len(self.DataSets) == 0:
             print("No data loaded, empty plot will be generated")
@@ -1804,6 +3558,8 @@ class Plotter(DataBank):
                 x = x[ 0, cols[0]:cols[1] ]
                 y = y[ rows[0]:rows[1], cols[0]:cols[1] ]
                 rc_reversal = False # the order of rows and columns is preserved
+                if not self.scatter_plots: # a line needs no more than 2 points per pixel column
+                    x, y = self.decimate_curves(S, y_idx, x, y, rows, cols, width)
             else:
                 # x varies by columns and y varies by rows, so if x_idx == 'y' and x2_idx == 'x'
                 #   then the row and column slicing must be swapped accordingly.
@@ -2118,44 +3874,43 @@ class Plotter(DataBank):
             cmap = meta_color_data #sets to the calculated cmap
 
         if type(cmap) == dict: 
-            my_cmap = mpl.colors.ListedColormap(cmap)
-            for col in columns:
-                for s in meta_col_data[col]:
-                    colors.append(np.array([meta_color_data[s][col] * colors[s]]))
+            curve_colors = [np.outer(np.broadcast_to(meta_color_data[s], len(X2linear[s])), colors[s]) for s in range(len(X))]
 
         elif type(cmap) == str:
             if discrete:
                 my_cmap = plt.get_cmap(cmap, len(X2linear[0]))
             else:
                 my_cmap = plt.get_cmap(cmap)
-            colors = my_cmap(plt.Normalize(X2[0].min(), X2[0].max())(X2[0]))
+            norm = plt.Normalize(X2[0].min(), X2[0].max())
+            curve_colors = [my_cmap(norm(X2linear[s])) for s in range(len(X))]
 
         ### CREATE COLORBAR ###
         if cbar:
             self._colorbar(X2linear, discrete, cmap, fig, ax1, labels[1])
 
         ### PLOT DATA ###
-        for col in columns:
-            for s in meta_col_data[col]:
-                # Plot Data
-                if not rc_reversal:
-                    if self.scatter_plots:
-                        ax1.scatter(X[s][col], X2[s][col, :], Y[s][col],
-                                color = colors[col][0], 
-                                marker = markers[s])
-                    else:
-                        ax1.plot(X[s][col], X2[s][col, :], Y[s][col],
-                            color = colors[col][0],
-                            linestyle = line_styles[s],
-                            marker = markers[s]
-                            )
-                else:
-                    print("\nERROR: plotting along 'y' direction not yet supported\n")
-                    plt.show()
-                    return
-                    # ax1.scatter(X[s][col, :], X2[s][:, col], Y[s][col, :],
-                    #             color = colors[col][0], 
-                    #             marker = markers[s])
+        if rc_reversal:
+            print("\nERROR: plotting along 'y' direction not yet supported\n")
+            plt.show()
+            return
+        # every curve goes into one collection, in the drawing order set by pov
+        order = [(col, s) for col in columns for s in meta_col_data[col]]
+        segments = [np.column_stack((X[s][col], X2[s][col, :], Y[s][col])) for col, s in order]
+        if not self.scatter_plots:
+            ax1.add_collection3d(art3d.Line3DCollection(segments, colors = [curve_colors[s][col] for col, s in order],
+                                                        linestyles = [line_styles[s] for col, s in order]))
+            ax1.auto_scale_xyz(*np.concatenate(segments).T, had_data = False)
+        zmargin = ax1.get_zmargin()
+        for s in range(len(X)): # the points/markers, as one collection per DataSet
+            if markers[s] in ('', ' ', 'None', 'none'):
+                continue
+            options = {} if self.scatter_plots else dict(self.plot_marker_style(markers[s]), depthshade = False)
+            rows = [col for col, t in order if t == s]
+            ax1.scatter(X[s][rows].ravel(), X2[s][rows].ravel(), Y[s][rows].ravel(),
+                        color = np.repeat([curve_colors[s][col] for col in rows], X[s].shape[1], axis = 0),
+                        marker = markers[s], **options)
+        if not self.scatter_plots:
+            ax1.set_zmargin(zmargin) # scatter() widens the z margin, which the markers of ax1.plot() didn't
 
         ### CREATE LEGEND ###
         if self.show_legend:
@@ -2189,26 +3944,9 @@ class Plotter(DataBank):
             the non-selected independent axis will be represented via sidebar 
         hint: to know which index correpsonds to what header, use the get_indices() method    
         '''
-        for col, sets in meta_col_data.items():
-            for s in sets:
-                if type(meta_color_data) == dict:
-                    color = meta_color_data[s][col] * self.colors[s]
-                else: # type(meta_col_data) == mpl.colors.LinearSegmentedColormap:
-                    my_cmap = plt.get_cmap(meta_color_data)
-                    color = my_cmap( int(256*plt.Normalize(X2[0].min(0),X2[0].max(0))(X2[s][col])) )
-                if not rc_reversal:
-                    if self.scatter_plots:
-                        ax.scatter(X[s], Y[s][col, :], 
-                                color = color,
-                                marker = self.markers[s])
-                    else:
-                        ax.plot(X[s], Y[s][col, :], 
-                                color = color,
-                                marker = self.markers[s])
-                else:
-                    ax.scatter(X[s], Y[s][:, col], 
-                                color = color, 
-                                marker = self.markers[s])
+        norm = plt.Normalize(X2[0].min(0),X2[0].max(0))
+        set_colors = [self.curve_colors(s, X2, self.colors, meta_color_data, meta_color_data, norm) for s in range(len(X))]
+        self.draw_sets2d(ax, X, Y, rc_reversal, meta_col_data, set_colors, self.markers, ['-']*len(X), self.scatter_plots)
 
     def quick_div_plot2d(self, x_idx, y_idx, DivSet:DataSet, divIdx, drop_zeros=True, tolerance: float = -1, cmap:str = None):
         ''''''
@@ -2413,6 +4151,8 @@ class Plotter(DataBank):
                 x = x[ 0, cols[0]:cols[1] ]
                 y = y[ rows[0]:rows[1], cols[0]:cols[1] ]
                 rc_reversal = False # the order of rows and columns is preserved
+                if not self.scatter_plots: # a line needs no more than 2 points per pixel column
+                    x, y = self.decimate_curves(S, y_idx, x, y, rows, cols, int(ax1.bbox.width))
             else:
                 # x varies by columns and y varies by rows, so if x_idx == 'y' and x2_idx == 'x'
                 #   then the row and column slicing must be swapped accordingly.
@@ -2450,30 +4190,9 @@ class Plotter(DataBank):
 
         if markers_toggle == False: 
             markers = ['' for marker in markers]    
-        for col, sets in meta_col_data.items():
-            for s in sets:
-                if type(cmap) == dict:
-                    color = meta_color_data[s][col] * colors[s]
-                else: # type(meta_col_data) == mpl.colors.LinearSegmentedColormap:
-                    my_cmap = plt.get_cmap(cmap)
-                    color = my_cmap( int(256* plt.Normalize(X2[0].min(), X2[0].max())(X2[s][col])) )
-                if not rc_reversal:
-                    if self.scatter_plots:
-                        ax1.scatter(X[s], Y[s][col, :], 
-                                color = color, 
-                                linestyle = line_styles[s],
-                                marker = markers[s]
-                                )
-                    else:
-                        ax1.plot(X[s], Y[s][col, :], 
-                                color = color,
-                                linestyle = line_styles[s],
-                                marker = markers[s])
-                else:
-                    ax1.scatter(X[s], Y[s][:, col], 
-                                color = color, 
-                                linestyle = line_styles[s],
-                                marker = markers[s])
+        norm = plt.Normalize(X2[0].min(), X2[0].max())
+        set_colors = [self.curve_colors(s, X2, colors, cmap, meta_color_data, norm) for s in range(len(X))]
+        self.draw_sets2d(ax1, X, Y, rc_reversal, meta_col_data, set_colors, markers, line_styles, self.scatter_plots)
         if self.show_legend:
             if type(cmap) == str: # if a preset colormap is being used, 
                 colors = [(0, 0, 0) for color in colors] # set all line colors to black
@@ -2497,6 +4216,275 @@ class Plotter(DataBank):
         if self.show_fig:
             plt.show()
 
+    def heatmap_data(self, Zindex = -1, sets: list[int] = None, DivSet: DataSet = None, divIdx = None,
+                     drop_zeros: bool = False, tolerance: float = -1) -> list[dict]:
+        """The data heatmap2d() draws: the Zindex data of each DataSet, or its ratio to DivSet's divIdx data
+        (see divide()), restricted to the domain. The axes come from the uniform sweep grid of m_intervals_info.
+
+        Output: list of dicts of 'index' -> index of the DataSet
+                                 'x', 'y' -> increasing values of the columns and rows
+                                 'z' -> (rows, cols) array
+                                 'uniform' -> whether x and y are evenly spaced"""
+        if sets is None:
+            sets = range(len(self.DataSets))
+        if DivSet is not None:
+            ratios = self.divide(DivSet, divIdx, Zindex, drop_zeros, tolerance)
+            rows_of = {i: r for r, i in enumerate(ratios['sets'])}
+        panels = []
+        for i in sets:
+            S = self.DataSets[i]
+            if DivSet is None:
+                z = S.get_data(Zindex)
+                x, y = grid_values(sweep_grid(S))
+                uniform = True
+            elif i in rows_of:
+                z = ratios['ratio'][rows_of[i]]
+                if drop_zeros: # the dropped rows/columns break up the grid
+                    x, y = ratios['axes'][0][rows_of[i]][0, :], ratios['axes'][1][rows_of[i]][:, 0]
+                    uniform = False
+                else: # everything was divided on DivSet's grid
+                    x, y = grid_values(sweep_grid(DivSet))
+                    uniform = True
+            else:
+                print(f"DataSet {i} wasn't swept on the grid of {DivSet.Info.data_name}, leaving it out")
+                continue
+            if z.shape != (len(y), len(x)): # the intervals info doesn't describe the data, use the data's own axes
+                x, y = S.get_data(0)[0, :], S.get_data(1)[:, 0]
+                uniform = False
+            if len(x) > 1 and x[0] > x[-1]: # sweeps that go down are flipped, so the axes increase
+                x, z = x[::-1], z[:, ::-1]
+            if len(y) > 1 and y[0] > y[-1]:
+                y, z = y[::-1], z[::-1, :]
+            cols = np.searchsorted(x, self.domain['x'][0]), np.searchsorted(x, self.domain['x'][1], side='right')
+            rows = np.searchsorted(y, self.domain['y'][0]), np.searchsorted(y, self.domain['y'][1], side='right')
+            panels.append({'index': i, 'x': x[cols[0]:cols[1]], 'y': y[rows[0]:rows[1]],
+                           'z': z[rows[0]:rows[1], cols[0]:cols[1]], 'uniform': uniform})
+        return panels
+
+    def heatmap2d(self, Zindex = -1, sets: list[int] = None, DivSet: DataSet = None, divIdx = None, drop_zeros: bool = False,
+                  tolerance: float = -1, contours = None, cmap: str = 'viridis', method: str = 'auto', cbar: bool = True,
+                  figsize: tuple = None):
+        """Displays the Zindex data (or the ratio to DivSet's divIdx data) of DataSets as heatmaps over the x/y sweep,
+            one panel per DataSet sharing one color scale. This draws a single image per DataSet, so even
+            1000x1000 sweeps render in a fraction of a second, unlike wireframes or one curve per row.
+        Input:
+            Zindex = header index of the data to map
+            sets = indices of the DataSets to show, all of them by default
+            DivSet, divIdx = DataSet and header index to divide by, see divide().
+                drop_zeros = False keeps the grid whole, with blank points where the divisor is 0
+            contours = number of contour levels, or a list of the levels, to draw over the heatmaps
+            cmap = MatPlotLib colormap name
+            method = 'imshow' -> one image per DataSet, only for evenly spaced sweeps
+                     'pcolormesh' -> one quad per point, for any spacing
+                     'auto' -> 'imshow' where possible
+            cbar = show a colorbar (with the contour levels marked on it)
+        """
+        if len(self.DataSets) == 0:
+            print("No data loaded, empty plot generated")
+            plt.show()
+            return
+        if method not in ('auto', 'imshow', 'pcolormesh'):
+            print(f"\nERROR: 'method' value of {method} not allowed. Choose from 'auto', 'imshow' or 'pcolormesh'. Defaulting to 'auto'\n")
+            method = 'auto'
+
+        panels = self.heatmap_data(Zindex, sets, DivSet, divIdx, drop_zeros, tolerance)
+        panels = [p for p in panels if p['z'].size > 0]
+        if len(panels) == 0:
+            print("No data left in the domain, empty plot generated")
+            plt.show()
+            return
+
+        ### CREATE PLOT ###
+        ncols = int(np.ceil(np.sqrt(len(panels))))
+        nrows = int(np.ceil(len(panels)/ncols))
+        fig, axs = plt.subplots(nrows, ncols, figsize = figsize, squeeze = False, sharex = True, sharey = True)
+        for ax in axs.flat[len(panels):]:
+            ax.set_visible(False)
+
+        ### HANDLE LABELLING ###
+        labels = [self.DataSets[0].get_data_name(0),
+                  self.DataSets[0].get_data_name(1),
+                  'div' if DivSet is not None else self.DataSets[0].get_data_name(Zindex)]
+        if self.auto_labels:
+            labels = self.make_auto_labels(labels[0], labels[1], labels[2])
+        if len(panels) == 1:
+            axs[0, 0].set_xlabel(labels[0])
+            axs[0, 0].set_ylabel(labels[1])
+        else: # the panels share their axes
+            fig.supxlabel(labels[0])
+            fig.supylabel(labels[1])
+        if DivSet is not None:
+            fig.suptitle(f"Performance Plot Relative to {DivSet.Info.data_name}")
+        else:
+            fig.suptitle(self.Bank_Info.data_name)
+
+        ### ONE COLOR SCALE FOR ALL PANELS ###
+        finite = [p['z'][np.isfinite(p['z'])] for p in panels]
+        finite = np.concatenate(finite) if any(f.size for f in finite) else np.zeros(1)
+        norm = plt.Normalize(finite.min(), finite.max())
+        if contours is not None and type(contours) == int:
+            contours = mpl.ticker.MaxNLocator(contours + 1).tick_values(norm.vmin, norm.vmax)
+
+        for p, ax in zip(panels, axs.flat):
+            x, y, z = p['x'], p['y'], p['z']
+            ax.set_title(self.DataSets[p['index']].Info.data_name)
+            if method == 'pcolormesh' or not p['uniform'] or len(x) < 2 or len(y) < 2:
+                image = ax.pcolormesh(x, y, z, shading = 'nearest', cmap = cmap, norm = norm)
+            else:
+                dx, dy = (x[-1] - x[0])/(len(x) - 1), (y[-1] - y[0])/(len(y) - 1)
+                image = ax.imshow(z, origin = 'lower', aspect = 'auto', interpolation = 'nearest', cmap = cmap, norm = norm,
+                                  extent = (x[0] - dx/2, x[-1] + dx/2, y[0] - dy/2, y[-1] + dy/2))
+            lines = None
+            if contours is not None and min(z.shape) > 1:
+                lines = ax.contour(x, y, z, levels = contours, colors = 'k', linewidths = 0.6)
+
+        if cbar:
+            bar = fig.colorbar(image, ax = axs, label = labels[2])
+            if lines is not None:
+                bar.add_lines(lines)
+
+        self.mpl_fig, self.mpl_ax = fig, axs
+        if self.show_fig:
+            plt.show()
+
+    def live_plot2d(self, Readers, x_idx, y_idx, block: bool = True, cmap: str = None, cbar: bool = True, discrete: bool = True):
+        """Plots sweeps that are still being read by LiveReaders, updating a single figure as their rows arrive.
+            The axes, colorbar and legend are drawn once. After that, only the curves that received new points
+            are updated and redrawn via blitting, at most max_fps times per second.
+        Input: 
+            Readers = a LiveReader or a list of them. Their DataSets are added to the Plotter
+            x_idx = 'x'/0, the swept variable, which is the order the points arrive in
+            y_idx = 2/3/-1 and will select data for y-axis of 2D plot
+            block = True  -> keeps refreshing the figure until every sweep is complete
+                    False -> returns once the figure is set up. Call live_refresh() to update it
+            cmap, cbar, discrete = as in quick_plot2d()
+        """
+        if type(Readers) == LiveReader:
+            Readers = [Readers]
+        if x_idx not in [0, 'x']:
+            print(" Error: live plots follow the sweep along x, choose x_idx of 0/'x'")
+            return
+        for R in Readers:
+            if R.Set not in self.DataSets:
+                self.append(R.Set)
+        Readers = [R for R in Readers if R.Set in self.DataSets] # append() refuses mismatching DataSets
+        if len(Readers) == 0:
+            print("No data loaded, no live plot generated")
+            return
+
+        fig, ax1 = plt.subplots(1)
+        self.mpl_fig, self.mpl_ax = fig, ax1
+
+        ### HANDLE LABELLING ###
+        labels = [self.DataSets[0].get_data_name(0),
+                    self.DataSets[0].get_data_name(1),
+                    self.DataSets[0].get_data_name(y_idx)]
+        if self.auto_labels:
+            labels = self.make_auto_labels(labels[0], labels[1], labels[2])
+        ax1.set_xlabel(labels[0])
+        ax1.set_ylabel(labels[2])
+        ax1.set_title(self.Bank_Info.data_name)
+
+        # the intervals are known from the header, so the axes and colors are set before any data arrives
+        X = [list(R.Set.m_intervals.values())[0] for R in Readers] # primary sweep (x)
+        X2 = [list(R.Set.m_intervals.values())[1] for R in Readers] # secondary sweep (y)
+        ax1.set_xlim(min(x.min() for x in X), max(x.max() for x in X))
+        meta_col_data, meta_color_data = self.create_projection_mapping(X2)
+        if not cmap:
+            cmap = meta_color_data
+        if cbar == True:
+            self._colorbar(X2, discrete, cmap, fig, ax1, labels[1])
+
+        ### ONE ANIMATED LINE PER CURVE ###
+        self.__live_lines = []
+        norm = plt.Normalize(X2[0].min(), X2[0].max())
+        set_colors = [np.array(R.Set.color) for R in Readers]
+        for s, R in enumerate(Readers):
+            colors = self.curve_colors(s, X2, set_colors, cmap, meta_color_data, norm) # every curve's color at once
+            set_lines = []
+            for row in range(R.Set.m_dim2_count):
+                color = colors[min(row, len(X2[s]) - 1)]
+                line, = ax1.plot([], [], color = color, linestyle = R.Set.ln_style, marker = R.Set.marker, animated = True)
+                set_lines.append(line)
+            self.__live_lines.append(set_lines)
+
+        if self.show_legend:
+            for R in Readers:
+                ax1.plot([], [], linestyle = R.Set.ln_style, color = R.Set.color, marker = R.Set.marker, label = R.Set.Info.data_name)
+            if self.legend_title:
+                ax1.legend(title = self.legend_title, loc = self.legend_loc)
+            else:
+                ax1.legend(loc = self.legend_loc)
+
+        self.__live_readers = Readers
+        self.__live_y_idx = y_idx
+        self.__live_yrange = [float('inf'), -float('inf')] # of the data read so far
+        self.__live_pending = False # whether curves changed since the last redraw
+        self.__last_draw = -float('inf')
+        if self.show_fig:
+            plt.show(block = False)
+        fig.canvas.draw()
+        self.__background = fig.canvas.copy_from_bbox(ax1.bbox) # everything but the curves
+        self.live_refresh(force = True)
+        if not block:
+            return
+
+        while not all(R.complete for R in Readers):
+            fig.canvas.start_event_loop(1 / self.max_fps) # keeps the window responsive without redrawing it
+            self.live_refresh()
+        self.live_refresh(force = True)
+        for set_lines in self.__live_lines: # make the finished figure an ordinary one, e.g. for saving
+            for line in set_lines:
+                line.set_animated(False)
+        fig.canvas.draw_idle()
+        if self.show_fig:
+            plt.show()
+
+    def live_refresh(self, force: bool = False) -> bool:
+        """Reads the rows that arrived since the last refresh of the live_plot2d() figure and updates the curves
+            they belong to. The figure itself is redrawn at most max_fps times per second, unless force is True.
+        Output: whether the figure was redrawn"""
+        if not self.__live_readers:
+            return False
+        for s, R in enumerate(self.__live_readers):
+            before = R.rows_read
+            R.update()
+            if R.rows_read == before:
+                continue
+            dim1 = R.Set.m_dim1_count
+            x = R.Set.get_data(0)
+            y = R.Set.get_data(self.__live_y_idx)
+            for row in range(before // dim1, -(-R.rows_read // dim1)): # rows (curves) that received points
+                start, stop = max(before - row*dim1, 0), min(R.rows_read - row*dim1, dim1)
+                self.__live_lines[s][row].set_data(x[row, :stop], y[row, :stop])
+                self.__live_yrange = [min(self.__live_yrange[0], y[row, start:stop].min()),
+                                      max(self.__live_yrange[1], y[row, start:stop].max())]
+            self.__live_pending = True
+
+        now = perf_counter()
+        if not self.__live_pending or (not force and now - self.__last_draw < 1 / self.max_fps):
+            return False
+        fig, ax1 = self.mpl_fig, self.mpl_ax
+
+        low, high = ax1.get_ylim()
+        if self.__live_yrange[0] < low or self.__live_yrange[1] > high or self.__last_draw == -float('inf'):
+            # new data is off the plot: rescale, and redraw the (static) background once
+            pad = 0.05 * (self.__live_yrange[1] - self.__live_yrange[0]) or 0.05 * abs(self.__live_yrange[1]) or 1
+            ax1.set_ylim(self.__live_yrange[0] - pad, self.__live_yrange[1] + pad)
+            fig.canvas.draw()
+            self.__background = fig.canvas.copy_from_bbox(ax1.bbox)
+
+        fig.canvas.restore_region(self.__background)
+        for set_lines in self.__live_lines:
+            for line in set_lines:
+                if len(line.get_xdata()):
+                    ax1.draw_artist(line)
+        fig.canvas.blit(ax1.bbox)
+        fig.canvas.flush_events()
+        self.__last_draw = now
+        self.__live_pending = False
+        return True
+
     def div_plot2d(self, x_idx, y_idx, DivSet:DataSet, divIdx, drop_zeros=True, tolerance: float = -1):
         '''Unfinished function; do not use.'''
         X, X2, Y, rc_reversal = self.get_div_data2d(x_idx, y_idx, DivSet,divIdx, drop_zeros, tolerance)
@@ -2574,25 +4562,24 @@ class Plotter(DataBank):
             return
 
         X, X2, Y = [], [], []
+        x_axis, x2_axis = self.process_axis(x_idx, num_output=True), self.process_axis(x2_idx, num_output=True)
+        ratios = self.divide(DivSet, divIdx, y_idx, drop_zeros, tolerance, (x_axis, x2_axis))
 
         for i, S in enumerate(self.DataSets):
             S_data_dims = (S.m_dim1_count, S.m_dim2_count)
 
-            # if dimensinos mismatch, omit the data set
-            if S_data_dims != div_data_dims:
+            # if dimensinos mismatch (and they weren't regridded), omit the data set
+            if i not in ratios['sets']:
                 print(f"DataSet at index ({i}) does not have matching x,y array dimensions of the dividing DataSet")
                 print(f"\t{S_data_dims} =/= {div_data_dims}")
                 print(f"Skipping DataSet ({i}) in DataBank")
                 # add a "skipped DataSets" list here to keep track of for labelling later down the line
                 continue
 
-            ydiv: list = DivSet.get_data(divIdx)
-            x: list = S.get_data(self.process_axis(x_idx, num_output=True))
-            x2: list= S.get_data(self.process_axis(x2_idx, num_output=True))
-            y: list = S.get_data(y_idx)/ydiv
-
-            if drop_zeros:
-                ydiv, x, x2, y = self.drop_zeros([ydiv, x, x2, y], tolerance)
+            n = ratios['sets'].index(i)
+            x: list = ratios['axes'][x_axis][n]
+            x2: list= ratios['axes'][x2_axis][n]
+            y: list = ratios['ratio'][n]
 
 
             if x2_idx == 'y': # if x2_idx is the 2nd indep variable (corresponding to y axis in 3d plot)
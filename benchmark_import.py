@@ -0,0 +1,49 @@
+# Benchmark for how long `import TransistorDataVisualizer` takes.
+# matplotlib should only be imported once something is plotted, so parse/analysis-only scripts start fast.
+# Run with `python benchmark_import.py`. Each import is timed in a fresh interpreter.
+import os
+import subprocess
+import sys
+from pathlib import Path
+from statistics import median
+
+REPEATS = 5
+HERE = Path(__file__).resolve().parent
+ENV = dict(os.environ, MPLBACKEND = 'Agg') # no windows, without importing matplotlib up front
+
+IMPORT_ONLY = """
+from time import perf_counter
+start = perf_counter()
+import TransistorDataVisualizer
+print(perf_counter() - start)
+import sys
+print('matplotlib' in sys.modules)
+"""
+
+IMPORT_AND_PLOT = """
+from time import perf_counter
+start = perf_counter() # before matplotlib is imported, so its import is timed too
+import TransistorDataVisualizer
+TransistorDataVisualizer.plt.subplots()
+print(perf_counter() - start)
+print(True)
+"""
+
+def time_import(code: str) -> tuple[float, bool]:
+    '''Runs code in a fresh interpreter. Returns the median time it printed and whether matplotlib was imported.'''
+    times = []
+    for _ in range(REPEATS):
+        out = subprocess.run([sys.executable, '-c', code], cwd = HERE, env = ENV, capture_output = True, text = True, check = True)
+        seconds, mpl_imported = out.stdout.split()
+        times.append(float(seconds))
+    return median(times), mpl_imported == 'True'
+
+if __name__ == '__main__':
+    import_time, mpl_imported = time_import(IMPORT_ONLY)
+    plot_time, _ = time_import(IMPORT_AND_PLOT)
+    print(f"import TransistorDataVisualizer:            {import_time*1000:8.1f} ms")
+    print(f"import TransistorDataVisualizer + a figure: {plot_time*1000:8.1f} ms")
+    if mpl_imported:
+        print("FAIL: matplotlib was imported before anything was plotted")
+        sys.exit(1)
+    print("OK: matplotlib is only imported when plotting")
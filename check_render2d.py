@@ -0,0 +1,75 @@
+# Render check for the batched 2D curve drawing (DataBank.draw_sets2d()).
+# Draws the same multi-DataSet plots twice: once as the package does, with one LineCollection and one marker
+# collection, and once the old way, with one ax.plot()/ax.scatter() call per curve. Then it compares the pixels.
+# Curves of different DataSets stack in the same order either way, so plots without markers must come out identical.
+# With markers, the markers of all curves sit above all lines. Markers of several shapes in one collection can also
+# land on slightly different subpixel positions. Those plots are only reported.
+# Run with `python check_render2d.py`.
+import sys
+import warnings
+from pathlib import Path
+import numpy as np
+import matplotlib
+matplotlib.use('Agg') # no windows
+import matplotlib.pyplot as plt
+import TransistorDataVisualizer as tdv
+
+HERE = Path(__file__).resolve().parent
+CSV = str(HERE / 'Id-Vds var const Vbgs_n1.csv')
+warnings.filterwarnings('ignore', message = "The pixel maker ','") # the old scatter() path warns about ','
+
+def draw_per_curve(self, ax, X, Y, rc_reversal, meta_col_data, set_colors, markers, line_styles, scatter):
+    '''The old drawing loop: one artist per curve, column by column, DataSet by DataSet.'''
+    for col, sets in meta_col_data.items():
+        for s in sets:
+            y = Y[s][:, col] if rc_reversal else Y[s][col, :]
+            if scatter or rc_reversal:
+                ax.scatter(X[s], y, color = set_colors[s][col], marker = markers[s])
+            else:
+                ax.plot(X[s], y, color = set_colors[s][col], marker = markers[s], linestyle = line_styles[s])
+
+def render(plot) -> np.ndarray:
+    plt.close('all')
+    plot()
+    fig = plt.gcf()
+    fig.canvas.draw()
+    return np.asarray(fig.canvas.buffer_rgba(), dtype = float)/255
+
+# made once: every new DataSet gets the next color, marker and line style
+SETS = [tdv.DataSet(tdv.DataFile(code, CSV)) for code in ['Ib2', 'Ib3', 'Ib4']]
+for k, S in enumerate(SETS): # scaled so the curves of different DataSets cross each other
+    S.m_datadict[S.get_headers()[-1]] = S.get_data(-1)*(1 + k)
+
+def bank(scatter: bool = False) -> tdv.Plotter:
+    P = tdv.Plotter(SETS[0])
+    for S in SETS[1:]:
+        P.append(S)
+    P.show_fig = False
+    P.scatter_plots = scatter
+    return P
+
+CASES = [ # name, plot, must be identical
+    ('lines', lambda: bank().quick_plot2d(0, -1, markers = False), True),
+    ('lines, colormap', lambda: bank().quick_plot2d(0, -1, markers = False, cmap = 'coolwarm'), True),
+    ('lines and markers', lambda: bank().quick_plot2d(0, -1), False),
+    ('scatter', lambda: bank(True).quick_plot2d(0, -1), False),
+    ('y as x (scatter)', lambda: bank().quick_plot2d('y', -1), False),
+]
+
+if __name__ == '__main__':
+    failed = False
+    batched = tdv.DataBank.draw_sets2d
+    for name, plot, exact in CASES:
+        tdv.DataBank.draw_sets2d = batched
+        new = render(plot)
+        tdv.DataBank.draw_sets2d = draw_per_curve
+        old = render(plot)
+        tdv.DataBank.draw_sets2d = batched
+        differ = (np.abs(new - old).max(axis = -1) > 0.1).mean()
+        print(f"{name:20s} {100*differ:6.2f}% of pixels differ")
+        if exact and differ > 0:
+            failed = True
+    if failed:
+        print("FAIL: plots without markers should render exactly as with one artist per curve")
+        sys.exit(1)
+    print("OK: overlapping curves stack as with one artist per curve")
@@ -0,0 +1,53 @@
+# Tests for appending to a CampaignArchive when the write is cut short. Run with `python -m pytest tests`.
+import sys
+from pathlib import Path
+import numpy as np
+import pytest
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+import TransistorDataVisualizer as tdv
+
+CSV = str(ROOT / 'Id-Vds var const Vbgs_n1.csv')
+
+def make_sets(codes: list) -> list:
+    return [tdv.DataSet(tdv.DataFile(code, CSV)) for code in codes]
+
+def assert_archive_holds(path, sets: list):
+    stored = tdv.CampaignArchive(path).DataSets()
+    assert [S.file_code for S in stored] == [S.file_code for S in sets]
+    for S, T in zip(stored, sets):
+        assert np.array_equal(S.get_data(-1), T.get_data(-1))
+
+def test_failed_append_leaves_archive_as_it_was(tmp_path, monkeypatch):
+    path = tmp_path / 'campaign.tdva'
+    first = make_sets(['Ib2', 'Ib3'])
+    tdv.CampaignArchive(path).write(first)
+    size = path.stat().st_size
+
+    write_chunk = tdv.CampaignArchive._CampaignArchive__write_chunk
+    calls = []
+    def failing_write_chunk(self, f, array, compress):
+        calls.append(1)
+        if len(calls) == 3: # partway through the second DataSet
+            raise OSError("disk full")
+        return write_chunk(self, f, array, compress)
+    monkeypatch.setattr(tdv.CampaignArchive, '_CampaignArchive__write_chunk', failing_write_chunk)
+    with pytest.raises(OSError):
+        tdv.CampaignArchive(path).write(make_sets(['Ib4', 'Ib6']))
+    monkeypatch.undo()
+
+    assert path.stat().st_size == size
+    assert_archive_holds(path, first)
+
+def test_reopen_skips_tail_of_interrupted_append(tmp_path):
+    path = tmp_path / 'campaign.tdva'
+    first = make_sets(['Ib2', 'Ib3'])
+    tdv.CampaignArchive(path).write(first)
+    with open(path, 'ab') as f: # the process died after writing part of a chunk
+        f.write(np.arange(1000, dtype = float).tobytes()[:3001])
+    assert_archive_holds(path, first)
+
+    more = make_sets(['Ib4'])
+    tdv.CampaignArchive(path).write(more) # overwrites the partial chunk
+    assert_archive_holds(path, first + more)
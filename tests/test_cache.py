@@ -0,0 +1,26 @@
+# Tests for ParseCache. Run with `python -m pytest tests`.
+import sys
+from pathlib import Path
+import numpy as np
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+import TransistorDataVisualizer as tdv
+
+CSV = str(ROOT / 'Id-Vds var const Vbgs_n1.csv')
+
+def test_more_precise_load_replaces_entry(tmp_path, monkeypatch):
+    monkeypatch.setattr(tdv.File, 'cache', tdv.ParseCache(tmp_path))
+    tdv.File(tdv.DataFile('Ib2', CSV), dtype = np.float32) # caches float32 data
+    full = tdv.File(tdv.DataFile('Ib2', CSV)) # can't use it, so parses and caches float64
+    entries = list(tmp_path.iterdir())
+    assert len(entries) == 1 and np.load(entries[0] / 'data.npy').dtype == np.float64
+
+    parsed = []
+    process_csv = tdv.File._File__process_csv
+    monkeypatch.setattr(tdv.File, '_File__process_csv', lambda self, path: (parsed.append(path), process_csv(self, path)))
+    again = tdv.File(tdv.DataFile('Ib2', CSV))
+    single = tdv.File(tdv.DataFile('Ib2', CSV), dtype = np.float32)
+    assert parsed == [] # both came from the cache
+    assert np.array_equal(again.get_data(-1), full.get_data(-1))
+    assert single.get_data(-1).dtype == np.float32
@@ -0,0 +1,41 @@
+# Tests for the aggregate DataSets of DataBank.groupby(). Run with `python -m pytest tests`.
+import sys
+from pathlib import Path
+import numpy as np
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+import TransistorDataVisualizer as tdv
+
+CSV = str(ROOT / 'Id-Vds var const Vbgs_n1.csv')
+
+def make_bank() -> tdv.DataBank:
+    sets = [tdv.DataSet(tdv.DataFile(code, CSV)) for code in ['Ib2', 'Ib3', 'Ib4']]
+    for k, S in enumerate(sets):
+        S.m_datadict[S.get_headers()[-1]] = S.get_data(-1)*(1 + k)
+    B = tdv.DataBank(sets[0])
+    for S in sets[1:]:
+        B.append(S)
+    return B
+
+def test_aggregate_survives_release():
+    B = make_bank()
+    agg = B.groupby(lambda S: 'all', stats = ('mean', 'std')).DataSets[0]
+    mean, std = agg.get_data(2).copy(), agg.get_data(3).copy()
+    headers = list(agg.get_headers())
+
+    agg.release()
+    assert agg.get_headers() == headers
+    assert np.array_equal(agg.get_data(2), mean)
+    assert np.array_equal(agg.get_data(3), std)
+    assert headers[2].endswith(' mean') and headers[3].endswith(' std')
+
+def test_aggregate_is_detached_from_template():
+    B = make_bank()
+    template = B.DataSets[0]
+    agg = B.groupby(lambda S: 'all').DataSets[0]
+    assert agg.file_path is None
+    assert agg.get_headers() is not template.get_headers()
+    template.release() # the template reloading from its csv doesn't touch the aggregate
+    assert template.get_data(-1).shape == agg.get_data(2).shape
+    assert len(agg.get_headers()) == 2 + 4
@@ -0,0 +1,57 @@
+# Tests for LiveReader.feed(). Run with `python -m pytest tests`.
+import sys
+from io import StringIO
+from pathlib import Path
+import numpy as np
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+import TransistorDataVisualizer as tdv
+
+CSV = str(ROOT / 'Id-Vds var const Vbgs_n1.csv')
+
+def make_reader() -> tuple[tdv.LiveReader, list]:
+    '''A LiveReader given the csv's header, and the csv's DataValue lines to feed it'''
+    with open(CSV, 'r') as f:
+        lines = f.readlines()
+    first = next(i for i, line in enumerate(lines) if line.startswith('DataValue'))
+    return tdv.LiveReader(tdv.DataFile('Ib7', CSV), StringIO(''.join(lines[:first]))), lines[first:]
+
+def test_malformed_row_keeps_later_rows_in_place():
+    ref = tdv.File(tdv.DataFile('Ib7', CSV))
+    R, lines = make_reader()
+    cols = ref.m_shape[1]
+    bad = cols + 3 # row 1, col 3
+    lines[bad] = 'DataValue, 1.5\n' # truncated
+    lines[bad + 5] = 'DataValue, 1.5, oops\n' # not a number
+    assert R.feed(lines[:2*cols]) == 2*cols
+    assert R.rows_read == 2*cols
+
+    Id = R.Set.get_data(-1)
+    assert np.isnan(Id[1, 3]) and np.isnan(Id[1, 8])
+    assert Id[1, 4] == ref.get_data(-1)[1, 4]
+    good = ~np.isnan(Id[:2])
+    assert good.sum() == 2*cols - 2
+    assert np.array_equal(Id[:2][good], ref.get_data(-1)[:2][good])
+    assert np.array_equal(R.Set.get_data(0)[1, 9:], ref.get_data(0)[1, 9:])
+    R.close()
+
+def test_divide_follows_live_data():
+    ref = tdv.DataSet(tdv.DataFile('Ib7', CSV))
+    R, lines = make_reader()
+    B = tdv.DataBank(R.Set)
+    half = len(lines)//2
+    R.feed(lines[:half])
+    first = B.divide(ref, -1, drop_zeros = False)['ratio'][0].copy()
+    R.feed(lines[half:])
+    ratio = B.divide(ref, -1, drop_zeros = False)['ratio'][0]
+    assert not np.array_equal(ratio, first, equal_nan = True)
+    assert np.allclose(ratio[ref.get_data(-1) != 0], 1)
+
+    D = tdv.DataBank(ref) # the live DataSet as the divisor: its zero rows get filled in, so fewer are dropped
+    R, lines = make_reader()
+    R.feed(lines[:half])
+    rows = D.divide(R.Set, -1, tolerance = 0)['ratio'].shape[1]
+    R.feed(lines[half:])
+    assert D.divide(R.Set, -1, tolerance = 0)['ratio'].shape[1] > rows
+    R.close()
@@ -0,0 +1,30 @@
+# Tests for sorting a DataBank by its metadata. Run with `python -m pytest tests`.
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+import TransistorDataVisualizer as tdv
+
+CSV = str(ROOT / 'Id-Vds var const Vbgs_n1.csv')
+
+def make_bank(codes: list) -> tdv.DataBank:
+    B = tdv.DataBank(tdv.DataSet(tdv.DataFile(codes[0], CSV)))
+    for code in codes[1:]:
+        B.append(tdv.DataSet(tdv.DataFile(code, CSV)))
+    return B
+
+def codes(B: tdv.DataBank) -> list:
+    return [S.file_code for S in B.DataSets]
+
+def test_sort_by_keeps_ties_in_order():
+    B = make_bank(['Ib2', 'Ib3', 'Ib4']) # areas 2500, 10000, 2500
+    assert codes(B.sort_by('area')) == ['Ib2', 'Ib4', 'Ib3']
+    assert codes(B.sort_by('area', reverse = True)) == ['Ib3', 'Ib2', 'Ib4']
+    assert codes(B.sort_by('gate', reverse = True)) == ['Ib2', 'Ib3', 'Ib4']
+
+def test_sort_by_puts_unknowns_last():
+    B = make_bank(['Ib2', 'Ib3', 'Ib4'])
+    B.DataSets[1].Info.chan_dims['area'] = None # unknown
+    assert codes(B.sort_by('area')) == ['Ib2', 'Ib4', 'Ib3']
+    assert codes(B.sort_by('area', reverse = True)) == ['Ib2', 'Ib4', 'Ib3']